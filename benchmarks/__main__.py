@@ -0,0 +1,47 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from benchmarks import bench_dispatch, bench_http, bench_params, bench_sign
+
+def run(concurrency=(1, 4, 16), requests=2000, url=None, quick=False):
+    scale = 10 if quick else 1
+    
+    return {
+        "meta": {
+            "timestamp": int(time.time()),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "micro": {
+            "sign": bench_sign.run(number=100000 // scale),
+            "params": bench_params.run(number=200000 // scale),
+            "create_request": bench_dispatch.run(number=200000 // scale),
+        },
+        "http": bench_http.run(concurrency, requests // scale, url),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="pybitapi benchmarks against a local stub of the Bitget REST API")
+    parser.add_argument("--output", default="bench_results.json", help="results file, '-' for stdout")
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per case and concurrency level")
+    parser.add_argument("--url", default=None, help="benchmark an already running server instead of the local stub")
+    parser.add_argument("--quick", action="store_true", help="a tenth of the iterations, for smoke runs")
+    args = parser.parse_args(argv)
+    
+    concurrency = tuple(int(level) for level in args.concurrency.split(","))
+    results = run(concurrency, args.requests, args.url, args.quick)
+    
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output == "-":
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import timeit
+from pybitapi import Client
+
+PLACE_ORDER = {
+    "symbol": "BTCUSDT", "side": "buy", "orderType": "limit", "force": "gtc",
+    "price": "25000", "size": "0.01", "clientOid": "bench-1"
+}
+HISTORY_ORDERS = {
+    "productType": "USDT-FUTURES", "symbol": "BTCUSDT", "startTime": 1700000000000,
+    "endTime": 1700086400000, "limit": 100, "orderId": "1"
+}
+
+def run(number=200000):
+    client = Client("key", "secret", "passphrase")
+    
+    # Only the endpoint dispatch and parameter validation are measured
+    client._request = lambda method, request_path, data: data
+    
+    results = {}
+    for name, params in (("spot_place_order", PLACE_ORDER), ("mix_get_history_order", HISTORY_ORDERS)):
+        method = getattr(client, name)
+        elapsed = timeit.timeit(lambda: method(**params), number=number)
+        results[name] = number / elapsed
+    
+    return results
+
+if __name__ == "__main__":
+    for name, rate in run().items():
+        print(f"{name:24} {rate:12,.0f} calls/s")
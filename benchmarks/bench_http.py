@@ -0,0 +1,124 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from pybitapi import Client
+from benchmarks.stub_server import StubProcess
+
+try:
+    from pybitapi import AsyncClient
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+SPOT_PLACE_ORDER = {
+    "symbol": "BTCUSDT", "side": "buy", "orderType": "limit", "force": "gtc",
+    "price": "25000", "size": "0.01", "clientOid": "bench-1"
+}
+MIX_PLACE_ORDER = {
+    "symbol": "BTCUSDT", "productType": "USDT-FUTURES", "marginMode": "crossed", "marginCoin": "USDT",
+    "size": "0.01", "side": "buy", "orderType": "limit", "price": "25000", "clientOid": "bench-1"
+}
+
+# Representative market data reads and order placements on both product lines
+CASES = (
+    ("spot_ticker_info", {"symbol": "BTCUSDT"}),
+    ("mix_ticker", {"symbol": "BTCUSDT", "productType": "USDT-FUTURES"}),
+    ("spot_place_order", SPOT_PLACE_ORDER),
+    ("mix_place_order", MIX_PLACE_ORDER),
+)
+
+# Client-side limiting, retries, caching and coalescing would measure policy rather than the request path
+CLIENT_OPTIONS = {"rate_limit": False, "retry": False, "cache": False, "coalesce": False}
+
+def percentile(values, q):
+    
+    # Nearest-rank on an already sorted list
+    index = max(int(round(q / 100 * len(values))) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+def summarize(latencies, elapsed):
+    latencies.sort()
+    count = len(latencies)
+    
+    return {
+        "requests": count,
+        "throughput": count / elapsed,
+        "mean_ms": sum(latencies) / count * 1000,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+def _timed_calls(method, params, count):
+    latencies = []
+    for _ in range(count):
+        started = perf_counter()
+        method(**params)
+        latencies.append(perf_counter() - started)
+    return latencies
+
+def run_case(client, name, params, concurrency, requests, warmup=20):
+    method = getattr(client, name)
+    _timed_calls(method, params, warmup)
+    
+    # Each worker owns an equal share of the requests and its own latency list
+    per_worker = max(requests // concurrency, 1)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = perf_counter()
+        futures = [executor.submit(_timed_calls, method, params, per_worker) for _ in range(concurrency)]
+        latencies = [latency for future in futures for latency in future.result()]
+        elapsed = perf_counter() - started
+    
+    return summarize(latencies, elapsed)
+
+async def _atimed_call(method, params, latencies):
+    started = perf_counter()
+    await method(**params)
+    latencies.append(perf_counter() - started)
+
+async def arun_case(client, name, params, concurrency, requests, warmup=20):
+    method = getattr(client, name)
+    for _ in range(warmup):
+        await method(**params)
+    
+    latencies = []
+    started = perf_counter()
+    await client.gather(*(_atimed_call(method, params, latencies) for _ in range(requests)), limit=concurrency)
+    elapsed = perf_counter() - started
+    
+    return summarize(latencies, elapsed)
+
+async def _arun(url, concurrency, requests):
+    results = {}
+    async with AsyncClient("key", "secret", "passphrase", base_url=url, max_concurrency=max(concurrency), pool_maxsize=max(concurrency), **CLIENT_OPTIONS) as client:
+        for name, params in CASES:
+            results[name] = {str(level): await arun_case(client, name, params, level, requests) for level in concurrency}
+    return results
+
+def run(concurrency=(1, 4, 16), requests=2000, url=None, use_async=True):
+    
+    # Without a url the stub exchange is started locally for the duration of the run
+    server = StubProcess().start() if url is None else None
+    url = url or server.url
+    
+    try:
+        results = {"sync": {}}
+        client = Client("key", "secret", "passphrase", base_url=url, pool_maxsize=max(concurrency), **CLIENT_OPTIONS)
+        try:
+            for name, params in CASES:
+                results["sync"][name] = {str(level): run_case(client, name, params, level, requests) for level in concurrency}
+        finally:
+            client.close()
+        
+        if use_async and aiohttp is not None:
+            results["async"] = asyncio.run(_arun(url, concurrency, requests))
+    finally:
+        if server is not None:
+            server.stop()
+    
+    return results
+
+if __name__ == "__main__":
+    for mode, cases in run().items():
+        for name, levels in cases.items():
+            for level, result in levels.items():
+                print(f"{mode:5} {name:18} c={level:>3} {result['throughput']:10,.0f} req/s  p50 {result['p50_ms']:7.3f} ms  p99 {result['p99_ms']:7.3f} ms")
@@ -0,0 +1,18 @@
+import timeit
+from pybitapi import utils
+
+PARAMS = {
+    "productType": "USDT-FUTURES", "symbol": "BTCUSDT", "granularity": "1m",
+    "startTime": 1700000000000, "endTime": 1700086400000, "limit": 1000
+}
+
+def run(number=200000):
+    elapsed = timeit.timeit(lambda: utils.parse_params_to_str(PARAMS), number=number)
+    
+    return {
+        "utils.parse_params_to_str": number / elapsed,
+    }
+
+if __name__ == "__main__":
+    for name, rate in run().items():
+        print(f"{name:28} {rate:12,.0f} calls/s")
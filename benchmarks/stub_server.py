@@ -0,0 +1,123 @@
+import json
+import multiprocessing
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Canned payloads shaped like the Bitget v2 responses, keyed by the path after /api/v2/
+RESPONSES = {
+    "public/time": lambda: {"serverTime": str(int(time.time() * 1000))},
+    "spot/market/tickers": lambda: [{
+        "symbol": "BTCUSDT", "high24h": "26000", "open": "25000", "low24h": "24500", "lastPr": "25500",
+        "quoteVolume": "1000000", "baseVolume": "40", "usdtVolume": "1000000", "bidPr": "25499",
+        "askPr": "25501", "bidSz": "1.5", "askSz": "2.1", "openUtc": "25100", "ts": str(int(time.time() * 1000)),
+        "changeUtc24h": "0.01", "change24h": "0.02"
+    }],
+    "mix/market/ticker": lambda: [{
+        "symbol": "BTCUSDT", "lastPr": "25500", "askPr": "25501", "bidPr": "25499", "bidSz": "3",
+        "askSz": "4", "high24h": "26000", "low24h": "24500", "ts": str(int(time.time() * 1000)),
+        "change24h": "0.02", "baseVolume": "400", "quoteVolume": "10000000", "usdtVolume": "10000000",
+        "openUtc": "25100", "indexPrice": "25490", "fundingRate": "0.0001", "holdingAmount": "1000"
+    }],
+    "spot/trade/place-order": lambda: {"orderId": str(time.perf_counter_ns()), "clientOid": "stub"},
+    "mix/order/place-order": lambda: {"orderId": str(time.perf_counter_ns()), "clientOid": "stub"},
+}
+
+class _Handler(BaseHTTPRequestHandler):
+    
+    # Keep-alive like the real API, and no Nagle delay on small responses
+    protocol_version = "HTTP/1.1"
+    wbufsize = 65536
+    disable_nagle_algorithm = True
+    
+    def log_message(self, *args):
+        pass
+    
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        
+        path = self.path.split("?", 1)[0]
+        key = path[len("/api/v2/"):] if path.startswith("/api/v2/") else path
+        data = RESPONSES.get(key, list)()
+        
+        body = json.dumps({"code": "00000", "msg": "success", "requestTime": int(time.time() * 1000), "data": data}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    do_GET = _respond
+    do_POST = _respond
+
+class _Server(ThreadingHTTPServer):
+    
+    # The default backlog of 5 overflows at high concurrency and stalls connects on SYN retransmits
+    request_queue_size = 1024
+    daemon_threads = True
+
+class StubServer():
+    
+    # Local stand-in for the Bitget REST API, answers every endpoint with a success payload
+    def __init__(self, host="127.0.0.1", port=0):
+        self._server = _Server((host, port), _Handler)
+        self._thread = None
+    
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def _serve(host, port, queue):
+    server = StubServer(host, port)
+    queue.put(server.url)
+    server._server.serve_forever()
+
+class StubProcess():
+    
+    # The stub in its own interpreter, so serving requests does not compete with the client for the GIL
+    def __init__(self, host="127.0.0.1", port=0):
+        self.host = host
+        self.port = port
+        self.url = None
+        self._process = None
+    
+    def start(self, timeout=10):
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        self._process = context.Process(target=_serve, args=(self.host, self.port, queue), daemon=True)
+        self._process.start()
+        self.url = queue.get(timeout=timeout)
+        return self
+    
+    def stop(self):
+        self._process.terminate()
+        self._process.join()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+
+if __name__ == "__main__":
+    server = StubServer(port=8000)
+    print(f"Serving the Bitget stub on {server.url}")
+    server._server.serve_forever()
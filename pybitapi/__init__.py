@@ -1,2 +1,4 @@
 from pybitapi.client import Client
-from pybitapi.variables import *
\ No newline at end of file
+from pybitapi.async_client import AsyncClient
+from pybitapi.websocket import PrivateWebsocketClient, WebsocketClient
+from pybitapi.variables import *
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from pybitapi.client import Client
+from pybitapi.chunking import merge_batch, split_batch
+from pybitapi.endpoints import ENDPOINTS
+from pybitapi.pagination import CURSOR_FIELDS, is_paginated, apaginate
+from pybitapi.session import AsyncSession
+from pybitapi.sharding import afetch_time_range
+from pybitapi.singleflight import AsyncSingleFlight
+from pybitapi.variables import *
+
+SERVER_TIME_PATH = ENDPOINTS["public_server_time"].path
+
+class AsyncClient(Client):
+    
+    session_class = AsyncSession
+    single_flight_class = AsyncSingleFlight
+    
+    def __init__(self, api_key, api_secret, passphrase, max_concurrency=100, pool_maxsize=100, **kwargs):
+        
+        super().__init__(api_key, api_secret, passphrase, pool_maxsize=pool_maxsize, **kwargs)
+        
+        # Default bound for gather
+        self.max_concurrency = max_concurrency
+        self._clock_task = None
+        self._clock_sync = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def close(self):
+        for task in (self._clock_task, self._clock_sync):
+            if task is not None:
+                task.cancel()
+        await self.session.close()
+    
+    async def server_time(self):
+        return int((await self.public_server_time())["data"]["serverTime"])
+    
+    def _start_clock(self):
+        # Needs a running loop, the first request starts it
+        pass
+    
+    async def sync_clock(self):
+        return await self.clock.async_sync(self.server_time)
+    
+    async def fetch_time_range(self, name, startTime, endTime, window=86400000, max_workers=8, **params):
+        return await afetch_time_range(self, name, startTime, endTime, window, max_workers, **params)
+    
+    async def _wait_clock(self):
+        # Requests wait for the first offset estimate, a failed one is retried by the next request
+        sync = self._clock_sync
+        if sync is None:
+            sync = self._clock_sync = asyncio.ensure_future(self.sync_clock())
+        
+        try:
+            await asyncio.shield(sync)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if self._clock_sync is sync:
+                self._clock_sync = None
+            raise
+        
+        if self._clock_task is None:
+            self._clock_task = asyncio.ensure_future(self.clock.run_async(self.server_time))
+    
+    async def _request(self, method, request_path, data):
+        
+        # The server time requests of the sync itself go straight through
+        if self.clock is not None and self._clock_task is None and request_path != SERVER_TIME_PATH:
+            await self._wait_clock()
+        
+        if method != GET:
+            return await self._fetch(method, request_path, data)
+        
+        path_key = request_path[len(API_VERSION):]
+        
+        cache = self.cache
+        key = cache.key(path_key, data) if cache is not None else None
+        if key is not None:
+            hit, response, refresh = cache.get(key)
+            if refresh:
+                asyncio.ensure_future(self._refresh(key, method, request_path, data))
+            if hit:
+                return response
+        
+        if self.single_flight is None:
+            response = await self._fetch(method, request_path, data)
+        else:
+            response = await self.single_flight.do((path_key, tuple(sorted(data.items()))), lambda: self._fetch(method, request_path, data))
+        
+        if key is not None:
+            cache.set(key, response)
+        return response
+    
+    async def _refresh(self, key, method, request_path, data):
+        try:
+            self.cache.set(key, await self._fetch(method, request_path, data))
+        except Exception:
+            self.cache.refresh_failed(key)
+    
+    async def _fetch(self, method, request_path, data):
+        policy = self.retry_policy
+        if policy is None or not policy.is_idempotent(method, data):
+            return await self._send(method, request_path, data, self.timeout)
+        
+        attempt = 0
+        started = time.monotonic()
+        while True:
+            try:
+                return await self._send(method, request_path, data, policy.attempt_timeout(started, self.timeout))
+            except Exception as error:
+                delay = policy.retry_delay(error, attempt, started, self.session.connection_errors)
+                if delay is None:
+                    raise
+            
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _send(self, method, request_path, data, timeout=None):
+        if self.clock is not None:
+            data = self._stamp(request_path, data)
+        timer = self._start_event(method, request_path, data)
+        status_code = body = content = None
+        
+        try:
+            if self.rate_limiter:
+                delay = self.rate_limiter.reserve(request_path[len(API_VERSION):])
+                if delay:
+                    await asyncio.sleep(delay)
+                if timer:
+                    timer.mark("throttle")
+            
+            url, body, header = self._prepare_request(method, request_path, data, timer)
+            
+            # Send request
+            status_code, content = await self.session.request(method, url, body, header, timeout)
+            if timer:
+                timer.mark("network")
+            
+            response = self._handle_response(status_code, content)
+            if timer:
+                timer.mark("decode")
+        except Exception as error:
+            self._end_event(timer, status_code, body, content, error)
+            raise
+        
+        self._end_event(timer, status_code, body, content)
+        return response
+    
+    async def _create_request(self, endpoint, params):
+        
+        # Validation runs on await, so every endpoint method behaves like a coroutine function
+        data = self._timed_validate(endpoint, params)
+        return self._decode(endpoint, await self._request(endpoint.method, endpoint.path, data))
+    
+    async def _create_batch_request(self, endpoint, params):
+        entries, chunks = split_batch(endpoint, self._timed_validate(endpoint, params))
+        
+        outcomes = await self.gather(*(self._request(endpoint.method, endpoint.path, chunk) for chunk in chunks), limit=self.batch_workers, return_exceptions=True)
+        
+        return merge_batch(endpoint, entries, chunks, outcomes)
+    
+    async def gather(self, *aws, limit=None, return_exceptions=False):
+        
+        # At most `limit` requests are in flight at once
+        semaphore = asyncio.Semaphore(limit or self.max_concurrency)
+        
+        async def run(aw):
+            async with semaphore:
+                return await aw
+        
+        return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+def _iterator_method(endpoint):
+    cursor_field = CURSOR_FIELDS.get(endpoint.name)
+    
+    def method(self, prefetch=False, **params):
+        return apaginate(getattr(self, endpoint.name), params, cursor_field, prefetch)
+    
+    method.__name__ = "iter_" + endpoint.name
+    method.__qualname__ = "AsyncClient.iter_" + endpoint.name
+    method.__doc__ = f"Async iterator over {endpoint.name} records, following the idLessThan cursor"
+    
+    return method
+
+# Paginated endpoints get async generator variants
+for _endpoint in ENDPOINTS.values():
+    if is_paginated(_endpoint):
+        setattr(AsyncClient, "iter_" + _endpoint.name, _iterator_method(_endpoint))
@@ -0,0 +1,144 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pybitapi.candles import TS, candle_rows, granularity_to_ms
+
+class CsvCandleStore():
+    
+    # One append-only CSV file per (symbol, productType, granularity)
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, key):
+        return os.path.join(self.directory, "_".join(key) + ".csv")
+    
+    def _complete_size(self, path):
+        # Size up to and including the last newline, a line without one is a torn write
+        if not os.path.exists(path):
+            return 0
+        
+        with open(path, "rb") as file:
+            end = file.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(end - 1024, 0)
+                file.seek(start)
+                index = file.read(end - start).rfind(b"\n")
+                if index != -1:
+                    return start + index + 1
+                end = start
+        return 0
+    
+    def last_timestamp(self, key):
+        path = self._path(key)
+        size = self._complete_size(path)
+        if not size:
+            return None
+        
+        # Read the tail only, files can hold years of bars
+        start = max(size - 1024, 0)
+        with open(path, "rb") as file:
+            file.seek(start)
+            lines = [line for line in file.read(size - start).splitlines() if line]
+        return int(lines[-1].split(b",", 1)[0])
+    
+    def append(self, key, rows):
+        path = self._path(key)
+        
+        # Drop any torn line left by an interrupted append, the backfill resumes before it
+        if os.path.exists(path):
+            size = self._complete_size(path)
+            if size != os.path.getsize(path):
+                os.truncate(path, size)
+        
+        with open(path, "a") as file:
+            file.writelines(",".join(str(value) for value in row) + "\n" for row in rows)
+            file.flush()
+            os.fsync(file.fileno())
+    
+    def read(self, key):
+        with open(self._path(key)) as file:
+            return [line.rstrip("\n").split(",") for line in file if line.endswith("\n")]
+
+class CandleBackfill():
+    
+    def __init__(self, client, store, max_workers=8, limit=200):
+        self.client = client
+        self.store = store
+        self.max_workers = max_workers
+        self.limit = limit
+    
+    def plan(self, granularity, start, end, method="spot_history_candlestick_data", **params):
+        step = granularity_to_ms(granularity)
+        span = step * self.limit
+        
+        # Each page covers `limit` bars in [page_start, page_end)
+        pages = []
+        page_start = start - start % step
+        while page_start < end:
+            page_end = min(page_start + span, end)
+            request = dict(params, granularity=granularity, endTime=page_end, limit=self.limit)
+            if method.startswith("mix_"):
+                request["startTime"] = page_start
+            pages.append((page_start, page_end, request))
+            page_start = page_end
+        
+        return pages
+    
+    def run(self, symbol, granularity, start, end, method="spot_history_candlestick_data", **params):
+        key = (symbol, params.get("productType", "SPOT"), granularity)
+        fetch = getattr(self.client, method)
+        
+        # Resume after the last bar already on disk
+        last = self.store.last_timestamp(key)
+        if last is not None:
+            start = max(start, last + granularity_to_ms(granularity))
+        
+        written = 0
+        pending = deque()
+        pages = self.plan(granularity, start, end, method, symbol=symbol, **params)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            
+            # Requests run concurrently but pages are written strictly in time order,
+            # so the last stored bar is always a valid resume point
+            for page in pages:
+                pending.append((page, executor.submit(fetch, **page[2])))
+                if len(pending) >= self.max_workers * 2:
+                    written, last = self._write(key, pending.popleft(), last, written)
+            
+            while pending:
+                written, last = self._write(key, pending.popleft(), last, written)
+        
+        return written
+    
+    def _write(self, key, item, last, written):
+        (page_start, page_end, request), future = item
+        
+        rows = candle_rows(future.result())
+        
+        # Decoded pages (decode_candles=True) are filtered as arrays and passed on as one
+        if not isinstance(rows, list):
+            ts = rows["ts"]
+            mask = (ts >= page_start) & (ts < page_end)
+            if last is not None:
+                mask &= ts > last
+            rows = rows[mask]
+            if len(rows):
+                last = int(rows["ts"][-1])
+        else:
+            page = rows
+            rows = []
+            for row in page:
+                ts = int(row[TS])
+                if page_start <= ts < page_end and (last is None or ts > last):
+                    rows.append(row)
+                    last = ts
+        
+        if len(rows):
+            self.store.append(key, rows)
+        
+        return written + len(rows), last
+    
+    def run_many(self, symbols, granularity, start, end, method="spot_history_candlestick_data", **params):
+        return {symbol: self.run(symbol, granularity, start, end, method, **params) for symbol in symbols}
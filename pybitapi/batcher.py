@@ -0,0 +1,147 @@
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pybitapi.exceptions import BitgetAPIException
+
+# Order fields sent once per batch, everything else goes into each orderList entry
+SPOT_GROUP_FIELDS = ("symbol",)
+MIX_GROUP_FIELDS = ("symbol", "productType", "marginMode", "marginCoin")
+
+class OrderBatcher():
+    
+    def __init__(self, client, window=0.002, max_batch=50, max_workers=4):
+        self.client = client
+        self.window = window
+        self.max_batch = max_batch
+        
+        # group key -> [deadline, [(order, future), ...]]
+        self._groups = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pybitapi-batcher")
+        self._thread = threading.Thread(target=self._run, name="pybitapi-batcher-flush", daemon=True)
+        self._thread.start()
+        self._stats = {"orders": 0, "batches": 0, "singles": 0}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def place_spot_order(self, **params):
+        return self._submit("spot", SPOT_GROUP_FIELDS, params)
+    
+    def place_mix_order(self, **params):
+        return self._submit("mix", MIX_GROUP_FIELDS, params)
+    
+    def _submit(self, market, group_fields, params):
+        # Results are matched back to callers by clientOid, orders without one get a generated id
+        order = dict(params)
+        order.setdefault("clientOid", uuid.uuid4().hex)
+        
+        key = (market,) + tuple(order.get(field) for field in group_fields)
+        future = Future()
+        
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("OrderBatcher is closed.")
+            
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = [time.monotonic() + self.window, []]
+            group[1].append((order, future))
+            self._stats["orders"] += 1
+            
+            # A full batch goes out without waiting for the window
+            if len(group[1]) >= self.max_batch:
+                group[0] = 0
+            self._condition.notify()
+        
+        return future
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed and not self._groups:
+                        return
+                    
+                    now = time.monotonic()
+                    due = [key for key, group in self._groups.items() if group[0] <= now or self._closed]
+                    if due:
+                        break
+                    
+                    timeout = min(group[0] for group in self._groups.values()) - now if self._groups else None
+                    self._condition.wait(timeout)
+                
+                batches = [(key, self._groups.pop(key)[1]) for key in due]
+            
+            for key, items in batches:
+                for start in range(0, len(items), self.max_batch):
+                    self._executor.submit(self._send, key[0], items[start:start + self.max_batch])
+    
+    def _send(self, market, items):
+        try:
+            # A lone order uses the single endpoint and keeps its usual response
+            if len(items) == 1:
+                order, future = items[0]
+                self._count("singles")
+                place = self.client.spot_place_order if market == "spot" else self.client.mix_place_order
+                future.set_result(place(**order))
+                return
+            
+            self._count("batches")
+            group_fields = SPOT_GROUP_FIELDS if market == "spot" else MIX_GROUP_FIELDS
+            params = {field: items[0][0][field] for field in group_fields if field in items[0][0]}
+            params["orderList"] = [{key: value for key, value in order.items() if key not in group_fields} for order, _ in items]
+            
+            if market == "spot":
+                response = self.client.spot_batch_place_order(**params)
+            else:
+                response = self.client.mix_batch_order(**params)
+        except Exception as error:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        
+        self._resolve(response, items)
+    
+    def _count(self, name):
+        with self._condition:
+            self._stats[name] += 1
+    
+    def _resolve(self, response, items):
+        data = response.get("data") or {}
+        successes = {item.get("clientOid"): item for item in data.get("successList") or []}
+        failures = {item.get("clientOid"): item for item in data.get("failureList") or []}
+        
+        for order, future in items:
+            client_oid = order["clientOid"]
+            if client_oid in successes:
+                future.set_result(dict(response, data=successes[client_oid]))
+            elif client_oid in failures:
+                failure = failures[client_oid]
+                future.set_exception(BitgetAPIException(200, {"code": failure.get("errorCode"), "msg": failure.get("errorMsg"), "data": failure}))
+            else:
+                future.set_exception(BitgetAPIException(200, {"code": None, "msg": "Order missing from batch response.", "data": {"clientOid": client_oid}}))
+    
+    def flush(self):
+        with self._condition:
+            for group in self._groups.values():
+                group[0] = 0
+            self._condition.notify()
+    
+    def stats(self):
+        with self._condition:
+            return dict(self._stats, pending=sum(len(group[1]) for group in self._groups.values()))
+    
+    def close(self):
+        # Sends whatever is queued, then waits for the submissions to finish
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Seconds, keyed by endpoint path without the version prefix
+DEFAULT_CACHE_TTLS = {
+    "spot/public/coins": 3600,
+    "spot/public/symbols": 3600,
+    "spot/market/vip-fee-rate": 86400,
+    "mix/market/vip-fee-rate": 86400,
+    "mix/market/contracts": 3600,
+}
+
+class TTLCache():
+    
+    def __init__(self, ttls=None, maxsize=1024, refresh_ahead=0.8, dumps=None, loads=None):
+        self.ttls = dict(DEFAULT_CACHE_TTLS)
+        self.ttls.update(ttls or {})
+        self.maxsize = maxsize
+        
+        # Values are stored encoded and every hit decodes its own copy, so callers editing a response
+        # cannot corrupt the entry, without them the stored object itself is returned
+        self.dumps = dumps
+        self.loads = loads
+        
+        # Fraction of the TTL after which a hit also schedules a background refresh, None disables it
+        self.refresh_ahead = refresh_ahead
+        
+        # key -> (value, stored_at, ttl), least recently used first
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = None
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "refreshes": 0}
+    
+    def key(self, path_key, params):
+        # None for endpoints that are not cached
+        if path_key not in self.ttls:
+            return None
+        return (path_key, tuple(sorted(params.items())))
+    
+    def get(self, key):
+        # Returns (hit, value, refresh), refresh is True for the one caller that should reload the entry
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[1] >= entry[2]:
+                self._stats["misses"] += 1
+                return False, None, False
+            
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            
+            refresh = False
+            if self.refresh_ahead is not None and now - entry[1] >= entry[2] * self.refresh_ahead and key not in self._refreshing:
+                self._refreshing.add(key)
+                self._stats["refreshes"] += 1
+                refresh = True
+            
+            value = entry[0]
+        
+        if self.loads is not None:
+            value = self.loads(value)
+        return True, value, refresh
+    
+    def set(self, key, value):
+        if self.dumps is not None:
+            value = self.dumps(value)
+        
+        with self._lock:
+            self._refreshing.discard(key)
+            self._entries[key] = (value, time.monotonic(), self.ttls[key[0]])
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+    
+    def refresh_failed(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+    
+    def refresh(self, key, fetch):
+        # Reloads an entry on a background thread while callers keep getting the cached value
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pybitapi-cache")
+        
+        def run():
+            try:
+                self.set(key, fetch())
+            except Exception:
+                self.refresh_failed(key)
+        
+        self._executor.submit(run)
+    
+    def invalidate(self, path_key=None, params=None):
+        with self._lock:
+            if path_key is None:
+                self._entries.clear()
+            elif params is not None:
+                self._entries.pop((path_key, tuple(sorted(params.items()))), None)
+            else:
+                for key in [key for key in self._entries if key[0] == path_key]:
+                    del self._entries[key]
+    
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
+    
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,103 @@
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bitget candle rows are [ts, open, high, low, close, baseVolume, ..., quoteVolume]
+TS = 0
+
+CANDLE_ENDPOINTS = frozenset({
+    "spot_candlestick_data",
+    "spot_history_candlestick_data",
+    "mix_candlestick_data",
+    "mix_historical_candlestick",
+    "mix_historical_index_price_candlestick",
+    "mix_historical_mark_price_candlestick",
+})
+
+CANDLE_FIELDS = ("ts", "open", "high", "low", "close", "base_volume", "quote_volume")
+
+CANDLE_DTYPE = np.dtype([("ts", "<i8")] + [(field, "<f8") for field in CANDLE_FIELDS[1:]]) if np is not None else None
+
+_GRANULARITY_RE = re.compile(r"^(\d+)(min|m|h|H|day|D|week|W)(utc)?$")
+
+_UNIT_MS = {
+    "min": 60000,
+    "m": 60000,
+    "h": 3600000,
+    "H": 3600000,
+    "day": 86400000,
+    "D": 86400000,
+    "week": 604800000,
+    "W": 604800000,
+}
+
+def granularity_to_ms(granularity):
+    # Accepts both spot ("1min", "4h", "1day") and mix ("1m", "4H", "1D") spellings, months have no fixed length
+    match = _GRANULARITY_RE.match(granularity)
+    if match is None:
+        raise ValueError(f"Unsupported granularity '{granularity}'.")
+    return int(match.group(1)) * _UNIT_MS[match.group(2)]
+
+def is_utc8_aligned(granularity):
+    # Bitget closes 6h and longer bars on UTC+8 boundaries unless the granularity carries the "utc" suffix
+    match = _GRANULARITY_RE.match(granularity)
+    if match is None:
+        raise ValueError(f"Unsupported granularity '{granularity}'.")
+    return match.group(3) is None and granularity_to_ms(granularity) >= 6 * _UNIT_MS["h"]
+
+def candle_rows(response):
+    data = response["data"]
+    
+    # Decoded arrays are already in time order
+    if not isinstance(data, list):
+        return data
+    
+    # Rows come back oldest first whatever order the endpoint used
+    return sorted(data, key=lambda row: int(row[TS]))
+
+def require_numpy():
+    if np is None:
+        raise ImportError("Decoding candles requires the 'numpy' package, install it with 'pip install numpy'.")
+
+def empty_candles(size=0):
+    require_numpy()
+    return np.empty(size, dtype=CANDLE_DTYPE)
+
+def decode_candles(rows):
+    require_numpy()
+    if len(rows) == 0:
+        return empty_candles()
+    
+    # One batched string to float conversion for the whole page, ms timestamps are exact in float64
+    values = np.array(rows, dtype=np.float64)
+    
+    candles = empty_candles(len(values))
+    candles["ts"] = values[:, 0]
+    candles["open"] = values[:, 1]
+    candles["high"] = values[:, 2]
+    candles["low"] = values[:, 3]
+    candles["close"] = values[:, 4]
+    candles["base_volume"] = values[:, 5]
+    
+    # Spot rows carry an extra USDT volume column, quote volume is always the last one
+    candles["quote_volume"] = values[:, -1]
+    
+    if len(candles) > 1 and candles["ts"][0] > candles["ts"][-1]:
+        candles = candles[::-1].copy()
+    
+    return candles
+
+def concat_candles(pages):
+    require_numpy()
+    pages = [page for page in pages if len(page)]
+    if not pages:
+        return empty_candles()
+    
+    candles = np.concatenate(pages)
+    
+    # Pages may overlap at their edges, keep one bar per timestamp in time order
+    _, index = np.unique(candles["ts"], return_index=True)
+    return candles[index]
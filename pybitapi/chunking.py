@@ -0,0 +1,74 @@
+import uuid
+
+# Batch endpoints that create orders, entries without a clientOid get one so results can be matched
+PLACEMENT_ENDPOINTS = frozenset({"spot_batch_place_order", "mix_batch_order"})
+
+def split_batch(endpoint, data):
+    # Returns the entries in input order and the request data of every chunk
+    list_param, size = endpoint.batch
+    entries = data[list_param]
+    
+    if endpoint.name in PLACEMENT_ENDPOINTS:
+        entries = [entry if entry.get("clientOid") else dict(entry, clientOid=uuid.uuid4().hex) for entry in entries]
+    
+    chunks = [dict(data, **{list_param: entries[start:start + size]}) for start in range(0, len(entries), size)]
+    return entries, chunks
+
+def _entry_ids(entry):
+    if isinstance(entry, dict):
+        return [value for value in (entry.get("clientOid"), entry.get("orderId")) if value]
+    return [entry]
+
+def merge_batch(endpoint, entries, chunks, outcomes):
+    # outcomes holds the response or the exception of every chunk, in chunk order
+    list_param, _ = endpoint.batch
+    
+    merged = None
+    errors = []
+    success_list = []
+    failure_list = []
+    results = []
+    
+    for chunk, outcome in zip(chunks, outcomes):
+        chunk_entries = chunk[list_param]
+        
+        if isinstance(outcome, Exception):
+            errors.append(outcome)
+            for entry in chunk_entries:
+                failure = {"errorCode": getattr(outcome, "code", None), "errorMsg": str(outcome)}
+                if isinstance(entry, dict):
+                    failure.update((key, entry[key]) for key in ("orderId", "clientOid") if key in entry)
+                else:
+                    failure["orderId"] = entry
+                failure_list.append(failure)
+                results.append(dict(failure, success=False))
+            continue
+        
+        if merged is None:
+            merged = {key: value for key, value in outcome.items() if key != "data"}
+        
+        data = outcome.get("data") or {}
+        successes = data.get("successList") or []
+        failures = data.get("failureList") or []
+        success_list.extend(successes)
+        failure_list.extend(failures)
+        
+        lookup = {}
+        for items, success in ((failures, False), (successes, True)):
+            for item in items:
+                for key in _entry_ids(item):
+                    lookup[key] = (item, success)
+        
+        for entry in chunk_entries:
+            match = next((lookup[key] for key in _entry_ids(entry) if key in lookup), None)
+            if match is None:
+                results.append({"success": False, "errorCode": None, "errorMsg": "Missing from batch response."})
+            else:
+                results.append(dict(match[0], success=match[1]))
+    
+    # Nothing went through, surface the first error as a single call would
+    if merged is None:
+        raise errors[0]
+    
+    merged["data"] = {"successList": success_list, "failureList": failure_list, "results": results}
+    return merged
@@ -1,1852 +1,386 @@
-import requests
-import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from pybitapi import utils
+from pybitapi.cache import TTLCache
+from pybitapi.clock import ServerClock
+from pybitapi.chunking import merge_batch, split_batch
+from pybitapi.candles import CANDLE_ENDPOINTS, decode_candles
+from pybitapi.endpoints import ENDPOINTS
+from pybitapi.hooks import Hooks, RequestEvent
+from pybitapi.metrics import Metrics
+from pybitapi.pagination import CURSOR_FIELDS, is_paginated, paginate
+from pybitapi.exceptions import BitgetAPIException
+from pybitapi.ratelimit import RateLimiter
+from pybitapi.retry import RetryPolicy
+from pybitapi.sharding import fetch_time_range
+from pybitapi.session import Session
+from pybitapi.singleflight import SingleFlight
 from pybitapi.variables import *
 
+# Endpoints accepting requestTime/receiveWindow
+REQUEST_TIME_PATHS = frozenset(endpoint.path for endpoint in ENDPOINTS.values() if "requestTime" in endpoint.optional)
+
 class Client():
+    
+    # Transport used by _request, AsyncClient swaps in an asyncio one
+    session_class = Session
+    single_flight_class = SingleFlight
    
-    def __init__(self, api_key, api_secret, passphrase):
+    def __init__(self, api_key, api_secret, passphrase, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive_timeout=30, json_dumps=None, json_loads=None, rate_limit=True, rate_limits=None, rate_limit_default=10, rate_limit_block=True, retry=True, retry_policy=None, decode_candles=False, cache=True, cache_ttls=None, cache_maxsize=1024, cache_refresh_ahead=0.8, coalesce=True, batch_workers=4, clock_sync=False, clock_sync_interval=300, receive_window=None, metrics=False, base_url=None, timeout=10):
        
         self.API_KEY = api_key
         self.API_SECRET = api_secret
         self.PASSPHRASE = passphrase
-      
-    def _request(self, method, request_path, data):
-        if method == GET:
-            request_path = request_path + utils.parse_params_to_str(data)
-            
-        # Create url
-        url = API_URL + request_path
-        
-        # Get local time
-        timestamp = utils.get_timestamp()
-        
-        body = json.dumps(data) if method == POST else ""
-        sign = utils.sign(utils.pre_hash(timestamp, method, request_path, str(body)), self.API_SECRET)
-        header = utils.get_header(self.API_KEY, sign, timestamp, self.PASSPHRASE)
-        
-        # Send request
-        response = None
-        if method == GET:
-            response = requests.get(url, headers=header)
-        elif method == POST:
-            response = requests.post(url, data=body, headers=header)
-            
-        # Exception handle
-        if not str(response.status_code).startswith('2'):
-            raise Exception(f"API Request Error: status code ({response.status_code}): {response.json()}")
-
-        return response.json()
-    
-    def _create_request(self, required_params, optional_params, type, category, endpoint, method, params):
-        
-        # Initialize data
-        data = {}
-        
-        # Check for required parameters and raise an error if any are missing
-        for param in required_params:
-            if param not in params:
-                raise ValueError(f"The '{param}' parameter is required.") 
-            else:
-                data[param] = params[param]
-        
-        # Check if eather orderId and clientOid are provided
-        if "orderId" in optional_params and "clientOid" in optional_params:
-            orderId = params.get("orderId")
-            clientOid = params.get("clientOid") 
-            
-            if orderId or clientOid:
-                pass
-            else:
-                raise ValueError("Either 'orderId' or 'clientOid' is required.")          
-        
-        # Add optional parameters if provided
-        for key, value in params.items():
-            if key in optional_params:
-                data[key] = value
-        
-        request_path = API_VERSION + type + "/" + category + "/" + endpoint  
-            
-        return self._request(method, request_path, data)
-            
-    # ########################################
-    # ############## SPOT MARKET #############
-    # ########################################
-    
-    def spot_coin_info(self, **params):
-        
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = ["coin"]
-        
-        # Request parameters
-        type = SPOT
-        category = PUBLIC
-        endpoint = "coins"
-        method = GET
- 
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-        
-    def spot_symbol_info(self, **params):
-        
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = ["symbol"]
-        
-        # Request parameters
-        type = SPOT
-        category = PUBLIC
-        endpoint = "symbols"
-        method = GET
-
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-        
-    def spot_vip_fee_rate(self, **params):
-        
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "vip-fee-rate"
-        method = GET
-
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-        
-    def spot_ticker_info(self, **params):
-        
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = ["symbol"]
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "tickers"
-        method = GET
-
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)        
-        
-    def spot_merge_depth(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = ["precision", "limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "merge-depth"
-        method = GET
-
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)        
-        
-    def spot_orderbook_depth(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = ["type", "limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "orderbook"
-        method = GET
-
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)        
-
-    def spot_candlestick_data(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "granularity"]
-        
-        # List of optional parameters
-        optional_params = ["startTime", "endTime", "limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "candles"
-        method = GET
-
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)            
-    
-    def spot_history_candlestick_data(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "granularity", "endTime"]
-        
-        # List of optional parameters
-        optional_params = ["limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "history-candles"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def spot_recent_trades(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = ["limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "fills"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)        
-    
-    def spot_market_trades(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = ["limit", "idLessThan", "startTime", "endTime"]
-        
-        # Request parameters
-        type = SPOT
-        category = MARKET
-        endpoint = "fills-history"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)        
-
-    # ########################################
-    # ############## SPOT TRADE ##############
-    # ########################################
-    
-    def spot_place_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["symbol", "side", "orderType", "force", "size"]
-        
-        # List of optional parameters
-        optional_params = [
-            "price", "clientOid", "triggerPrice", "tpslType", "requestTime",
-            "receiveWindow", "stpMode", "presetTakeProfitPrice",
-            "executeTakeProfitPrice", "presetStopLossPrice", "executeStopLossPrice"
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "plase-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)        
-    
-    def spot_cancel_replace_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["symbol", "price", "size"]
-        
-        # List of optional parameters
-        optional_params = [
-            "clientOid", "orderId", "newClientOid", "presetTakeProfitPrice",
-            "executeTakeProfitPrice", "presetStopLossPrice", "executeStopLossPrice"
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "cancel-replace-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                        
-    
-    def spot_cancel_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = ["tpslType", "orderId", "clientOid"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "cancel-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)        
-
-    def spot_batch_place_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["orderList", "side", "orderType", "force", "size"]
-        
-        # List of optional parameters
-        optional_params = [
-            "symbol", "batchMode", "price", "clientOid", "stpMode", "presetTakeProfitPrice",
-            "executeTakeProfitPrice", "presetStopLossPrice", "executeStopLossPrice"
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "batch-orders"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                        
-
-    def spot_batch_cancel_replace_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["orderList", "symbol", "price", "size"]
-        
-        # List of optional parameters
-        optional_params = [
-            "clientOid", "orderId", "newClientOid", "presetTakeProfitPrice",
-            "executeTakeProfitPrice", "presetStopLossPrice", "executeStopLossPrice"
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "batch-cancel-replace-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                        
-
-    def spot_batch_cancel_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["orderList"]
-        
-        # List of optional parameters
-        optional_params = ["symbol", "batchMode", "orderId", "clientOid"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "batch-cancel-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_cancel_order_symbol(self, **params):
-  
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "cancel-symbol-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-    
-    def spot_order_info(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = ["orderId", "clientOid", "requestTime", "receiveWindow"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "orderInfo"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_current_orders(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = [
-            "symbol", "startTime", "endTime", "idLessThan", "limit",
-            "orderId", "tpslType", "requestTime", "receiveWindow",        
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "unfilled-orders"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_history_orders(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = [
-            "symbol", "startTime", "endTime", "idLessThan", "limit",
-            "orderId", "tpslType", "requestTime", "receiveWindow",            
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "history-orders"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_fills(self, **params):
-  
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = ["orderId", "startTime", "endTime", "limit", "idLessThan"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "fills"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    # ########################################
-    # ############# SPOT TRIGGER #############
-    # ########################################
-    
-    def spot_place_plan_order(self, **params):
-  
-        # List of required parameters
-        required_params = [
-            "symbol", "side", "triggerPrice", "orderType", "size", "triggerType"
-        ]
-        
-        # List of optional parameters
-        optional_params = [
-            "executePrice", "planType", "clientOid", "force", "stpMode"          
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "place-plan-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_modify_plan_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["triggerPrice", "orderType", "size"]
-        
-        # List of optional parameters
-        optional_params = ["orderId", "clientOid", "executePrice"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "modify-plan-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-    
-    def spot_cancel_plan_order(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = ["orderId", "clientOid"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "cancel-plan-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_current_plan_orders(self, **params):
-  
-        # List of required parameters
-        required_params = ["symbol"]
-        
-        # List of optional parameters
-        optional_params = ["limit", "idLessThan", "startTime", "endTime"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "current-plan-order"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_plan_sub_order(self, **params):
-  
-        # List of required parameters
-        required_params = ["planOrderId"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "plan-sub-order"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_history_plan_orders(self, **params):
-  
-        # List of required parameters
-        required_params = ["symbol", "startTime", "endTime"]
-        
-        # List of optional parameters
-        optional_params = ["limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "history-plan-order"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_batch_cancel_plan_order(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = ["symbolList"]
-        
-        # Request parameters
-        type = SPOT
-        category = TRADE
-        endpoint = "batch-cancel-plan-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    # ########################################
-    # ############# SPOT ACCOUNT #############
-    # ########################################    
-    
-    def spot_get_account_info(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "info"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-    
-    def spot_get_account_assets(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = ["coin", "assetType"]
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "assets"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_sub_account_assets(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "subaccount-assets"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_modify_deposit_account(self, **params):
-  
-        # List of required parameters
-        required_params = ["accountType", "coin"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "modify-deposit-account"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_account_bills(self, **params):
-  
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = [
-            "coin", "groupType", "businessType", "startTime",
-            "endTime", "limit", "idLessThan"
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "bills"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-        
-    def spot_transfer(self, **params):
-  
-        # List of required parameters
-        required_params = ["fromType", "toType", "amount", "coin", "symbol"]
-        
-        # List of optional parameters
-        optional_params = ["clientOid"]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "transfer"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_transferable_coin_list(self, **params):
-  
-        # List of required parameters
-        required_params = ["fromType", "toType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "transfer-coin-info"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_sub_transfer(self, **params):
-  
-        # List of required parameters
-        required_params = [
-            "fromType", "toType", "amount",
-            "coin", "fromUserId", "toUserId"
-        ]
-        
-        # List of optional parameters
-        optional_params = ["symbol", "clientOid"]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "subaccount-transfer"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-    
-    def spot_withdraw(self, **params):
-  
-        # List of required parameters
-        required_params = ["coin", "transferType", "address", "size"]
-        
-        # List of optional parameters
-        optional_params = [
-            "chain", "innerToType", "areaCode", "tag", "remark", "clientOid"
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "withdrawal"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_mainsub_transfer_record(self, **params):
-    
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = [
-            "coin", "role", "subUid", "startTime",
-            "endTime", "clientOid", "limit", "idLessThan"
-        ]
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "sub-main-trans-record"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-
-    def spot_get_transfer_record(self, **params):
-    
-        # List of required parameters
-        required_params = ["coin", "fromType"]
-        
-        # List of optional parameters
-        optional_params = ["startTime", "endTime", "clientOid", "limit", "idLessThan"]
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "transferRecords"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)                
-        
-    def spot_switch_BGB_deduct(self, **params):
-        
-        # List of required parameters
-        required_params = ["deduct"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "switch-deduct"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-        
-    def spot_get_deposit_address(self, **params):
-        
-        # List of required parameters
-        required_params = ["coin"]
-        
-        # List of optional parameters
-        optional_params = ["chain", "size"]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "deposit-address"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def spot_get_subaccount_deposit_address(self, **params):
-        
-        # List of required parameters
-        required_params = ["subUid", "coin"]
-        
-        # List of optional parameters
-        optional_params = ["chain", "size"]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "subaccount-deposit-address"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def spot_get_BGB_deduct_info(self, **params):
-        
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = ACCOUNT
-        endpoint = "deduct-info"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def  spot_cancel_withdrawal(self, **params):
-        
-        # List of required parameters
-        required_params = ["orderId"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "cancel-withdrawal"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def spot_get_subaccount_deposit_records(self, **params):
-        
-        # List of required parameters
-        required_params = ["subUid"]
-        
-        # List of optional parameters
-        optional_params = ["coin", "startTime", "endTime", "idLessThan", "limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "subaccount-deposit-records"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def spot_get_withdrawal_records(self, **params):
-        
-        # List of required parameters
-        required_params = ["startTime", "endTime"]
-        
-        # List of optional parameters
-        optional_params = ["coin", "clientOid", "idLessThan", "orderId", "limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "withdrawal-records"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def spot_get_deposit_records(self, **params):
-        
-        # List of required parameters
-        required_params = ["startTime", "endTime"]
-        
-        # List of optional parameters
-        optional_params = ["coin", "orderId", "idLessThan", "limit"]
-        
-        # Request parameters
-        type = SPOT
-        category = WALLET
-        endpoint = "deposit-records"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    # ########################################
-    # ############ FUTURE MARKET #############
-    # ########################################
-    
-    def mix_vip_fee_rate(self, **params):
+        self.signer = utils.Signer(api_secret)
         
-        # List of required parameters
-        required_params = []
+        # Static part of every request header, only the timestamp and signature change per call
+        self._header_template = utils.get_header_template(api_key, passphrase)
+        self.header_template = MappingProxyType(self._header_template)
         
-        # List of optional parameters
-        optional_params = []
+        # JSON codec, orjson when installed and the standard library otherwise
+        self.json_dumps = json_dumps or utils.json_dumps
+        self.json_loads = json_loads or utils.json_loads
         
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "vip-fee-rate"
-        method = GET        
+        # Client-side token buckets per endpoint path, None disables limiting
+        self.rate_limiter = RateLimiter(rate_limit_default, rate_limits, rate_limit_block) if rate_limit else None
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_interest_rate_history(self, **params):
-        
-        # List of required parameters
-        required_params = ["coin"]
+        # Seconds per attempt, capped at what the retry deadline has left, None waits forever
+        self.timeout = timeout
         
-        # List of optional parameters
-        optional_params = []
+        # Backoff for 429/5xx and connection errors on idempotent requests, None disables retries
+        self.retry_policy = (retry_policy or RetryPolicy()) if retry else None
         
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "union-interest-rate-history"
-        method = GET        
+        # Candle responses as NumPy structured arrays instead of string lists
+        self.decode_candles = decode_candles
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_interest_exchange_rate(self, **params):
+        # Reference data (symbols, coins, contracts, fee rates) served from memory until its TTL expires
+        self.cache = TTLCache(cache_ttls, cache_maxsize, cache_refresh_ahead, self.json_dumps, self.json_loads) if cache else None
         
-        # List of required parameters
-        required_params = []
+        # Identical GETs in flight at the same time share one network call
+        self.single_flight = self.single_flight_class(self._copy_response) if coalesce else None
         
-        # List of optional parameters
-        optional_params = []
+        # Concurrent chunk submissions for batch endpoints given more entries than one call accepts
+        self.batch_workers = batch_workers
         
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "exchange-rate"
-        method = GET  
+        # Request timestamps from the monotonic clock plus the estimated server offset
+        self.clock = ServerClock(interval=clock_sync_interval) if clock_sync else None
+        self.receive_window = receive_window
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_discount_rate(self, **params):
+        # Per-phase latency histograms keyed by endpoint, None when collection is off
+        self.metrics = Metrics() if metrics else None
         
-        # List of required parameters
-        required_params = []
+        # pre_request, post_response and on_error callbacks, each called with a RequestEvent
+        self.hooks = Hooks()
         
-        # List of optional parameters
-        optional_params = []
+        # REST host, overridable for testnets, proxies and the benchmark stub server
+        self.base_url = (base_url or API_URL).rstrip("/")
         
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "discount-rate"
-        method = GET        
+        # Keep-alive connection pool reused by every endpoint method
+        self.session = self.session_class(pool_connections, pool_maxsize, pool_block, keep_alive_timeout)
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        if self.clock is not None:
+            self._start_clock()
     
-    def mix_merge_market_depth(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = ["precision", "limit"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "merge-depth"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def pool_stats(self):
+        return self.session.stats()
     
-    def mix_ticker(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "ticker"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def rate_limit_stats(self):
+        return self.rate_limiter.stats() if self.rate_limiter else {}
     
-    def mix_all_tickers(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "tickers"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-             
-    def mix_recent_transactions(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = ["limit"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "fills"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def single_flight_stats(self):
+        return self.single_flight.stats() if self.single_flight else {}
     
-    def mix_history_transactions(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = ["limit", "idLessThan", "startTime", "endTime"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "fills-history"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def cache_stats(self):
+        return self.cache.stats() if self.cache else {}
     
-    def mix_candlestick_data(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType", "granularity"]
-        
-        # List of optional parameters
-        optional_params = ["startTime", "endTime", "kLineType", "limit"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "candles"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_historical_candlestick(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType", "granularity"]
-        
-        # List of optional parameters
-        optional_params = ["startTime", "endTime", "limit"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "history-candles"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-            
-    def mix_historical_index_price_candlestick(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType", "granularity"]
-        
-        # List of optional parameters
-        optional_params = ["startTime", "endTime", "limit"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "history-index-candles"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def invalidate_cache(self, name=None, **params):
+        if self.cache:
+            self.cache.invalidate(ENDPOINTS[name].key if name else None, params or None)
     
-    def mix_historical_mark_price_candlestick(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType", "granularity"]
-        
-        # List of optional parameters
-        optional_params = ["startTime", "endTime", "limit"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "history-mark-candles"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-        
-    def mix_open_interest(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "open-interest"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)    
-        
-    def mix_next_funding_time(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "funding-time"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def latency_stats(self):
+        return self.metrics.snapshot() if self.metrics else {}
     
-    def mix_mark_index_market_prices(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "symbol-price"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def export_prometheus(self):
+        return self.metrics.to_prometheus() if self.metrics else ""
     
-    def mix_historical_funding_rates(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = ["pageSize", "pageNo"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "history-fund-rate"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def add_hook(self, event, callback):
+        return self.hooks.register(event, callback)
     
-    def mix_current_funding_rate(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "current-funding-rate"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def remove_hook(self, event, callback):
+        self.hooks.unregister(event, callback)
     
-    def mix_contract_config(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = ["symbol"]
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "contracts"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def server_time(self):
+        return int(self.public_server_time()["data"]["serverTime"])
     
-    # ########################################
-    # ############ FUTURE TRADE ##############
-    # ########################################
+    def _start_clock(self):
+        # The first requests are signed with server time already, later syncs run in the background
+        self.clock.sync(self.server_time)
+        self.clock.start(self.server_time)
     
-    def mix_place_order(self, **params):
-        
-        # List of required parameters
-        required_params = [
-            "symbol", "productType", "marginMode", "marginCoin",
-            "size", "side", "orderType"
-        ]
-        
-        # List of optional parameters
-        optional_params = [
-            "price", "tradeSide", "force", "clientOid", "reduceOnly", 
-            "presetStopSurplusPrice", "presetStopLossPrice", "priceProtect"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "place_order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def close(self):
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+        if self.clock:
+            self.clock.stop()
     
-    def mix_reversal(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "marginCoin", "productType", "size"]
-        
-        # List of optional parameters
-        optional_params = ["side", "tradeSide", "clientOid"]
+    def fetch_time_range(self, name, startTime, endTime, window=86400000, max_workers=8, **params):
         
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "click-backhand"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        # Splits [startTime, endTime] into windows fetched concurrently and merged in time order
+        return fetch_time_range(self, name, startTime, endTime, window, max_workers, **params)
     
-    def mix_batch_order(self, **params):
-        
-        # List of required parameters
-        required_params = [
-            "symbol", "productType", "marginMode", "marginCoin", 
-            "orderList", "size", "side", "orderType", 
-        ]
-        
-        # List of optional parameters
-        optional_params = [
-            "price", "tradeSide", "force", "clientOid", "reduceOnly"
-            "presetStopSurplusPrice", "presetStopLossPrice", "stpMode"
+    def _prepare_request(self, method, request_path, data, timer=None):
+        if method == GET:
+            request_path = request_path + utils.parse_params_to_str(data)
             
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "batch-place-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_modify_order(self, **params):
-      
-        # List of required parameters
-        required_params = ["symbol", "productType", "newClientOid" ]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "clientOid", "newSize", "newPrice",
-            "newPresetStopSurplusPrice", "newPresetStopLossPrice"            
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "modify-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_cancel_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = ["marginCoin", "orderId", "clientOid"]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "cancel-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_batch_cancel(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = ["orderIdList", "orderId", "clientOid", "symbol", "marginCoin"]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "batch-cancel-orders"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_flash_close_position(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = ["symbol", "holdSide"]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "close-positions"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_order_detail(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType"]
-        
-        # List of optional parameters
-        optional_params = ["orderId", "clientOid"]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "detail"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_order_fill_details(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "symbol", "idLessThan", 
-            "startTime", "endTime", "limit"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "fill-detail"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_historical_transaction_details(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "symbol", "startTime",
-            "endTime", "idLessThan", "limit"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "fill-history"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_pending_orders(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "clientOid", "symbol", "status",
-            "idLessThan", "startTime", "endTime", "limit"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "orders-pending"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_history_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "clientOid", "symbol", "idLessThan",
-            "orderSource", "startTime", "endTime", "limit"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "orders-history"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_cancel_all_orders(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = ["symbol", "marginCoin", "requestTime", "receiveWindow"]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "cancel-all-orders"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    # ########################################
-    # ########### FUTURE TRIGGER #############
-    # ######################################## 
-    
-    def mix_trigger_sub_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["planType", "planOrderId", "productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "plan-sub-order"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_stop_profit_and_stop_loss_plan_orders(self, **params):
-        
-        # List of required parameters
-        required_params = [
-            "marginCoin", "productType", "symbol", 
-            "clientOid", "stpMode",
-        ]
-        
-        # List of optional parameters
-        optional_params = [
-            "triggerType", "executePrice", "rangeRate", 
-            "triggerBy", "triggerTime", "orderSource", "orderTime"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "place-tpsl-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_place_trigger_order(self, **params):
-        
-        # List of required parameters
-        required_params = [
-            "planType", "symbol", "productType", "marginMode", "marginCoin", 
-            "size", "triggerPrice", "triggerType", "side", "orderType"
-        ]
-        
-        # List of optional parameters
-        optional_params = [
-            "price", "callbackRatio", "tradeSide", "clientOid",
-            "reduceOnly", "stopSurplusTriggerPrice", "stopSurplusExecutePrice",
-            "stopSurplusTriggerType", "stopLossTriggerPrice", "stopLossExecutePrice",
-            "stopLossTriggerType", "stpMode"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "place-plan-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_modify_stop_profit_and_stop_loss_plan_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["marginCoin", "productType", "symbol", "triggerPrice", "size"]
-        
-        # List of optional parameters
-        optional_params = ["orderId", "clientOid", "triggerType", "executePrice", "rangeRate"]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "modify-tpsl-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        # Create url
+        url = self.base_url + request_path
+        if timer:
+            timer.mark("query")
+        
+        # Get local time, or the server-synchronized one
+        timestamp = self.clock.now() if self.clock is not None else utils.get_timestamp()
+        
+        body = b""
+        if method == POST:
+            body = self.json_dumps(data)
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+        if timer:
+            timer.mark("encode")
+        
+        sign = self.signer.sign_request(timestamp, method, request_path, body)
+        header = utils.fill_header(self._header_template, sign, timestamp)
+        if timer:
+            timer.mark("sign")
+        
+        return url, body, header
+    
+    def _handle_response(self, status_code, content):
+        
+        # Exception handle, the body is decoded once and attached to the error
+        if not 200 <= status_code < 300:
+            try:
+                payload = self.json_loads(content)
+            except ValueError:
+                payload = content.decode('utf-8', errors='replace')
+            raise BitgetAPIException(status_code, payload)
+
+        return self.json_loads(content)
       
-    def mix_modify_trigger_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "clientOid", "newSize", "newPrice", 
-            "newCallbackRatio", "newTriggerPrice", "newTriggerType",
-            "newStopSurplusTriggerPrice", "newStopSurplusExecutePrice",
-            "newStopSurplusTriggerType", "newStopLossTriggerPrice",
-            "newStopLossExecutePrice", "newStopLossTriggerType",
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "modify-plan-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_pending_trigger_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["planType", "productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "clientOid", "symbol", "idLessThan",
-            "startTime", "endTime", "limit"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "orders-plan-pending"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_cancel_trigger_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderIdList", "orderId", "clientOid", "symbol", "marginCoin", "planType"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "cancel-plan-order"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_history_trigger_order(self, **params):
-        
-        # List of required parameters
-        required_params = ["planType", "productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "orderId", "clientOid", "planStatus", "symbol",
-            "idLessThan", "startTime", "endTime", "limit"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = ORDER
-        endpoint = "orders-plan-history"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    # ########################################
-    # ########### FUTURE ACCOUNT #############
-    # ########################################     
-    
-    def mix_get_single_account(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType", "marginCoin"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "account"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_get_account_list(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "accounts"
-        method = GET        
+    def _request(self, method, request_path, data):
+        if method != GET:
+            return self._fetch(method, request_path, data)
+        
+        path_key = request_path[len(API_VERSION):]
+        
+        cache = self.cache
+        key = cache.key(path_key, data) if cache is not None else None
+        if key is not None:
+            hit, response, refresh = cache.get(key)
+            if refresh:
+                cache.refresh(key, lambda: self._fetch(method, request_path, data))
+            if hit:
+                return response
+        
+        if self.single_flight is None:
+            response = self._fetch(method, request_path, data)
+        else:
+            response = self.single_flight.do((path_key, tuple(sorted(data.items()))), lambda: self._fetch(method, request_path, data))
+        
+        if key is not None:
+            cache.set(key, response)
+        return response
+    
+    def _fetch(self, method, request_path, data):
+        policy = self.retry_policy
+        if policy is None or not policy.is_idempotent(method, data):
+            return self._send(method, request_path, data, self.timeout)
+        
+        attempt = 0
+        started = time.monotonic()
+        while True:
+            try:
+                return self._send(method, request_path, data, policy.attempt_timeout(started, self.timeout))
+            except Exception as error:
+                delay = policy.retry_delay(error, attempt, started, self.session.connection_errors)
+                if delay is None:
+                    raise
+            
+            time.sleep(delay)
+            attempt += 1
+    
+    def _start_event(self, method, request_path, data):
+        
+        # Timer for the metrics and the hooks, None keeps _send free of any bookkeeping
+        hooks = self.hooks
+        if not hooks:
+            return self.metrics.timer(request_path[len(API_VERSION):]) if self.metrics is not None else None
+        
+        event = RequestEvent(request_path[len(API_VERSION):], method, data, self.metrics)
+        if hooks.pre_request:
+            hooks.emit(hooks.pre_request, event)
+        return event
+    
+    def _end_event(self, event, status_code, body, content, error=None):
+        if type(event) is not RequestEvent:
+            return
+        
+        event.status = status_code
+        event.request_size = len(body) if body is not None else 0
+        event.response_size = len(content) if content is not None else 0
+        event.error = error
+        event.finish()
+        
+        hooks = self.hooks
+        callbacks = hooks.on_error if error is not None else hooks.post_response
+        if callbacks:
+            hooks.emit(callbacks, event)
+    
+    def _stamp(self, request_path, data):
+        # Fresh requestTime from the synchronized clock for every attempt, so retries stay inside receiveWindow
+        if request_path in REQUEST_TIME_PATHS and "requestTime" not in data:
+            return dict(data, requestTime=self.clock.now())
+        return data
+    
+    def _send(self, method, request_path, data, timeout=None):
+        if self.clock is not None:
+            data = self._stamp(request_path, data)
+        timer = self._start_event(method, request_path, data)
+        status_code = body = content = None
+        
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(request_path[len(API_VERSION):])
+                if timer:
+                    timer.mark("throttle")
+            
+            url, body, header = self._prepare_request(method, request_path, data, timer)
+            
+            # Send request
+            status_code, content = self.session.request(method, url, body, header, timeout)
+            if timer:
+                timer.mark("network")
+            
+            response = self._handle_response(status_code, content)
+            if timer:
+                timer.mark("decode")
+        except Exception as error:
+            self._end_event(timer, status_code, body, content, error)
+            raise
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        self._end_event(timer, status_code, body, content)
+        return response
     
-    def mix_get_subaccount_assets(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "sub-account-assets"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def _create_request(self, endpoint, params):
+        data = self._timed_validate(endpoint, params)
+        return self._decode(endpoint, self._request(endpoint.method, endpoint.path, data))
     
-    def mix_get_USDTM_futures_interest_history(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
+    def _create_batch_request(self, endpoint, params):
         
-        # List of optional parameters
-        optional_params = ["coin", "idLessThan", "startTime", "endTime", "limit"]
+        # Validated once, then split to the per-call maximum and submitted concurrently
+        entries, chunks = split_batch(endpoint, self._timed_validate(endpoint, params))
         
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "interest-history"
-        method = GET        
+        if len(chunks) == 1:
+            outcomes = [self._try_request(endpoint, chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), self.batch_workers)) as executor:
+                outcomes = list(executor.map(lambda chunk: self._try_request(endpoint, chunk), chunks))
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        return merge_batch(endpoint, entries, chunks, outcomes)
     
-    def mix_my_estimated_open_count(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType", "marginCoin","openAmount", "openPrice"]
-        
-        # List of optional parameters
-        optional_params = ["leverage"]
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "open-count"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def _try_request(self, endpoint, data):
+        try:
+            return self._request(endpoint.method, endpoint.path, data)
+        except Exception as error:
+            return error
     
-    def mix_set_isolated_position_auto_margin(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "autoMargin", "marginCoin"]
-        
-        # List of optional parameters
-        optional_params = ["holdSide", "amount"]
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "set-auto-margin"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def _copy_response(self, response):
+        # Independent copy of a decoded JSON response for coalesced callers
+        return self.json_loads(self.json_dumps(response))
     
-    def mix_change_leverage(self, **params):
-        
-        # List of required parameters
-        required_params = ["symbol", "productType", "marginCoin", "leverage"]
-        
-        # List of optional parameters
-        optional_params = ["holdSide"]
+    def _decode(self, endpoint, response):
         
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "set-leverage"
-        method = POST        
+        # Opt-in structured arrays for candle endpoints, without touching a response another caller may hold
+        if self.decode_candles and endpoint.name in CANDLE_ENDPOINTS:
+            return dict(response, data=decode_candles(response["data"]))
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        return response
     
-    def mix_adjust_position_margin(self, **params):    
+    def _timed_validate(self, endpoint, params):
+        if self.metrics is None:
+            return self._validate(endpoint, params)
         
-        # List of required parameters
-        required_params = ["symbol", "productType", "marginCoin", "holdSide", "amount"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "set-margin"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        timer = self.metrics.timer(endpoint.key)
+        data = self._validate(endpoint, params)
+        timer.mark("validate")
+        return data
     
-    def mix_set_USDTM_futures_asset_mode(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType", "assetMode"]
+    def _validate(self, endpoint, params):
         
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "set-asset-mode"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
-    
-    def mix_change_margin_mode(self, **params):
+        # Initialize data
+        data = {}
         
-        # List of required parameters
-        required_params = ["symbol", "productType", "marginCoin", "marginMode"]
+        # Check for required parameters and raise an error if any are missing
+        for param in endpoint.required:
+            if param not in params:
+                raise ValueError(f"The '{param}' parameter is required.") 
+            else:
+                data[param] = params[param]
         
-        # List of optional parameters
-        optional_params = []
+        # Check if eather orderId and clientOid are provided
+        if endpoint.requires_order_ref:
+            if not (params.get("orderId") or params.get("clientOid")):
+                raise ValueError("Either 'orderId' or 'clientOid' is required.")          
         
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "set-margin-mode"
-        method = POST        
+        # Add optional parameters if provided
+        optional = endpoint.optional
+        for key, value in params.items():
+            if key in optional:
+                data[key] = value
         
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        # requestTime is stamped per attempt in _send, the window is the same for all of them
+        if self.clock is not None and self.receive_window is not None and "requestTime" in optional:
+            data.setdefault("receiveWindow", self.receive_window)
+            
+        return data
+
+def _endpoint_method(endpoint):
     
-    def mix_change_position_mode(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType", "posMode"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "set-position-mode"
-        method = POST        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def method(self, **params):
+        return self._create_request(endpoint, params)
     
-    def mix_get_account_bills(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = [
-            "coin", "businessType", "idLessThan", 
-            "startTime", "endTime", "limit"
-        ]
+    # Batch endpoints accept lists of any length and answer with per-entry results in input order
+    if endpoint.batch is not None:
+        list_param = endpoint.batch[0]
         
-        # Request parameters
-        type = MIX
-        category = ACCOUNT
-        endpoint = "bill"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+        def method(self, **params):
+            if params.get(list_param) is None:
+                return self._create_request(endpoint, params)
+            return self._create_batch_request(endpoint, params)
     
-    # ########################################
-    # ########### FUTURE POSITION ############
-    # ########################################         
+    method.__name__ = endpoint.name
+    method.__qualname__ = "Client." + endpoint.name
+    method.__doc__ = f"{endpoint.method} {endpoint.path}"
     
-    def mix_position_tier(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType", "symbol"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = MARKET
-        endpoint = "query-position-lever"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    return method
+
+def _iterator_method(endpoint):
+    cursor_field = CURSOR_FIELDS.get(endpoint.name)
     
-    def mix_single_position(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType", "symbol", "marginCoin"]
-        
-        # List of optional parameters
-        optional_params = []
-        
-        # Request parameters
-        type = MIX
-        category = POSITION
-        endpoint = "single-position"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    def method(self, prefetch=False, **params):
+        return paginate(getattr(self, endpoint.name), params, cursor_field, prefetch)
     
-    def mix_all_positions(self, **params):
-        
-        # List of required parameters
-        required_params = ["productType"]
-        
-        # List of optional parameters
-        optional_params = ["marginCoin"]
-        
-        # Request parameters
-        type = MIX
-        category = POSITION
-        endpoint = "all-position"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    method.__name__ = "iter_" + endpoint.name
+    method.__qualname__ = "Client.iter_" + endpoint.name
+    method.__doc__ = f"Iterator over {endpoint.name} records, following the idLessThan cursor"
     
-    def mix_historical_position(self, **params):
-        
-        # List of required parameters
-        required_params = []
-        
-        # List of optional parameters
-        optional_params = [
-            "symbol", "productType", "idLessThan",
-            "startTime", "endTime", "limit"
-        ]
-        
-        # Request parameters
-        type = MIX
-        category = POSITION
-        endpoint = "history-position"
-        method = GET        
-        
-        return self._create_request(required_params, optional_params, type, category, endpoint, method, params)
+    return method
+
+# Public endpoint methods are generated from the spec table in pybitapi.endpoints
+for _endpoint in ENDPOINTS.values():
+    setattr(Client, _endpoint.name, _endpoint_method(_endpoint))
     
-    
\ No newline at end of file
+    if is_paginated(_endpoint):
+        setattr(Client, "iter_" + _endpoint.name, _iterator_method(_endpoint))
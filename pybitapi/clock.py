@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+class ServerClock():
+    
+    # Milliseconds derived from the monotonic clock plus an offset estimated against the server,
+    # so wall-clock jumps and drift on the host do not leak into signed timestamps
+    def __init__(self, samples=5, interval=300):
+        self.samples = samples
+        self.interval = interval
+        
+        self._base_wall = time.time() * 1000
+        self._base_monotonic = time.monotonic()
+        self.offset = 0.0
+        self.rtt = None
+        self.synced_at = None
+        
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _local(self, monotonic):
+        return self._base_wall + (monotonic - self._base_monotonic) * 1000
+    
+    def now(self):
+        return int(self._local(time.monotonic()) + self.offset)
+    
+    def _update(self, samples):
+        # NTP style: the sample with the smallest round trip bounds the error best
+        rtt, offset = min(samples)
+        self.rtt = rtt
+        self.offset = offset
+        self.synced_at = time.monotonic()
+    
+    def _sample(self, sent, server_time, received):
+        rtt = (received - sent) * 1000
+        return rtt, server_time - self._local((sent + received) / 2)
+    
+    def sync(self, fetch_server_time):
+        samples = []
+        for _ in range(self.samples):
+            sent = time.monotonic()
+            server_time = fetch_server_time()
+            samples.append(self._sample(sent, server_time, time.monotonic()))
+        self._update(samples)
+        return self.offset
+    
+    async def async_sync(self, fetch_server_time):
+        samples = []
+        for _ in range(self.samples):
+            sent = time.monotonic()
+            server_time = await fetch_server_time()
+            samples.append(self._sample(sent, server_time, time.monotonic()))
+        self._update(samples)
+        return self.offset
+    
+    def start(self, fetch_server_time):
+        # Re-estimates the offset every `interval` seconds on a daemon thread, after an initial sync by the caller
+        def run():
+            while not self._stop.wait(self.interval):
+                try:
+                    self.sync(fetch_server_time)
+                except Exception:
+                    pass
+        
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name="pybitapi-clock", daemon=True)
+        self._thread.start()
+    
+    async def run_async(self, fetch_server_time):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.async_sync(fetch_server_time)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+    
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,436 @@
+from pybitapi.variables import *
+
+class Endpoint():
+    
+    __slots__ = ("name", "type", "category", "endpoint", "method", "required", "optional", "path", "key", "requires_order_ref", "batch")
+    
+    def __init__(self, name, type, category, endpoint, method, required, optional, batch=None):
+        
+        self.name = name
+        self.type = type
+        self.category = category
+        self.endpoint = endpoint
+        self.method = method
+        
+        # Compiled once so per-call validation only does set lookups
+        self.required = tuple(required)
+        self.optional = frozenset(optional)
+        
+        # Pre-joined request path and its key without the version prefix, e.g. "spot/trade/place-order"
+        self.key = "/".join(part for part in (type, category, endpoint) if part)
+        self.path = API_VERSION + self.key
+        
+        # (list parameter, max entries per call) for batch endpoints, longer lists are split into chunks
+        self.batch = batch
+        
+        # Endpoints accepting both identifiers need at least one of them, batch endpoints carry them per entry
+        self.requires_order_ref = "orderId" in self.optional and "clientOid" in self.optional and batch is None
+    
+    def __repr__(self):
+        return f"Endpoint({self.name!r}, {self.method} {self.path})"
+
+# Endpoint spec table: name, type, category, endpoint, method, required params, optional params[, batch]
+ENDPOINTS = {endpoint.name: endpoint for endpoint in (
+    # ########################################
+    # ################ PUBLIC ################
+    # ########################################
+    Endpoint("public_server_time", COMMON, PUBLIC, "time", GET,
+             (),
+             ()),
+    
+    # ########################################
+    # ############## SPOT MARKET #############
+    # ########################################
+    Endpoint("spot_coin_info", SPOT, PUBLIC, "coins", GET,
+             (),
+             ("coin",)),
+    Endpoint("spot_symbol_info", SPOT, PUBLIC, "symbols", GET,
+             (),
+             ("symbol",)),
+    Endpoint("spot_vip_fee_rate", SPOT, MARKET, "vip-fee-rate", GET,
+             (),
+             ()),
+    Endpoint("spot_ticker_info", SPOT, MARKET, "tickers", GET,
+             (),
+             ("symbol",)),
+    Endpoint("spot_merge_depth", SPOT, MARKET, "merge-depth", GET,
+             ("symbol",),
+             ("precision", "limit")),
+    Endpoint("spot_orderbook_depth", SPOT, MARKET, "orderbook", GET,
+             ("symbol",),
+             ("type", "limit")),
+    Endpoint("spot_candlestick_data", SPOT, MARKET, "candles", GET,
+             ("symbol", "granularity"),
+             ("startTime", "endTime", "limit")),
+    Endpoint("spot_history_candlestick_data", SPOT, MARKET, "history-candles", GET,
+             ("symbol", "granularity", "endTime"),
+             ("limit",)),
+    Endpoint("spot_recent_trades", SPOT, MARKET, "fills", GET,
+             ("symbol",),
+             ("limit",)),
+    Endpoint("spot_market_trades", SPOT, MARKET, "fills-history", GET,
+             ("symbol",),
+             ("limit", "idLessThan", "startTime", "endTime")),
+
+    # ########################################
+    # ############## SPOT TRADE ##############
+    # ########################################
+    Endpoint("spot_place_order", SPOT, TRADE, "place-order", POST,
+             ("symbol", "side", "orderType", "force", "size"),
+             (
+                 "price", "clientOid", "triggerPrice", "tpslType", "requestTime", "receiveWindow",
+                 "stpMode", "presetTakeProfitPrice", "executeTakeProfitPrice",
+                 "presetStopLossPrice", "executeStopLossPrice"
+             )),
+    Endpoint("spot_cancel_replace_order", SPOT, TRADE, "cancel-replace-order", POST,
+             ("symbol", "price", "size"),
+             (
+                 "clientOid", "orderId", "newClientOid", "presetTakeProfitPrice",
+                 "executeTakeProfitPrice", "presetStopLossPrice", "executeStopLossPrice"
+             )),
+    Endpoint("spot_cancel_order", SPOT, TRADE, "cancel-order", POST,
+             ("symbol",),
+             ("tpslType", "orderId", "clientOid")),
+    Endpoint("spot_batch_place_order", SPOT, TRADE, "batch-orders", POST,
+             ("orderList",),
+             (
+                 "symbol", "batchMode", "side", "orderType", "force", "size", "price", "clientOid", "stpMode",
+                 "presetTakeProfitPrice", "executeTakeProfitPrice", "presetStopLossPrice", "executeStopLossPrice"
+             ),
+             batch=("orderList", 50)),
+    Endpoint("spot_batch_cancel_replace_order", SPOT, TRADE, "batch-cancel-replace-order", POST,
+             ("orderList",),
+             (
+                 "symbol", "price", "size", "clientOid", "orderId", "newClientOid", "presetTakeProfitPrice",
+                 "executeTakeProfitPrice", "presetStopLossPrice", "executeStopLossPrice"
+             ),
+             batch=("orderList", 50)),
+    Endpoint("spot_batch_cancel_order", SPOT, TRADE, "batch-cancel-order", POST,
+             ("orderList",),
+             ("symbol", "batchMode", "orderId", "clientOid"),
+             batch=("orderList", 50)),
+    Endpoint("spot_cancel_order_symbol", SPOT, TRADE, "cancel-symbol-order", POST,
+             ("symbol",),
+             ()),
+    Endpoint("spot_order_info", SPOT, TRADE, "orderInfo", GET,
+             (),
+             ("orderId", "clientOid", "requestTime", "receiveWindow")),
+    Endpoint("spot_current_orders", SPOT, TRADE, "unfilled-orders", GET,
+             (),
+             (
+                 "symbol", "startTime", "endTime", "idLessThan", "limit", "orderId", "tpslType",
+                 "requestTime", "receiveWindow"
+             )),
+    Endpoint("spot_history_orders", SPOT, TRADE, "history-orders", GET,
+             (),
+             (
+                 "symbol", "startTime", "endTime", "idLessThan", "limit", "orderId", "tpslType",
+                 "requestTime", "receiveWindow"
+             )),
+    Endpoint("spot_fills", SPOT, TRADE, "fills", GET,
+             ("symbol",),
+             ("orderId", "startTime", "endTime", "limit", "idLessThan")),
+
+    # ########################################
+    # ############# SPOT TRIGGER #############
+    # ########################################
+    Endpoint("spot_place_plan_order", SPOT, TRADE, "place-plan-order", POST,
+             ("symbol", "side", "triggerPrice", "orderType", "size", "triggerType"),
+             ("executePrice", "planType", "clientOid", "force", "stpMode")),
+    Endpoint("spot_modify_plan_order", SPOT, TRADE, "modify-plan-order", POST,
+             ("triggerPrice", "orderType", "size"),
+             ("orderId", "clientOid", "executePrice")),
+    Endpoint("spot_cancel_plan_order", SPOT, TRADE, "cancel-plan-order", POST,
+             (),
+             ("orderId", "clientOid")),
+    Endpoint("spot_get_current_plan_orders", SPOT, TRADE, "current-plan-order", GET,
+             ("symbol",),
+             ("limit", "idLessThan", "startTime", "endTime")),
+    Endpoint("spot_get_plan_sub_order", SPOT, TRADE, "plan-sub-order", GET,
+             ("planOrderId",),
+             ()),
+    Endpoint("spot_get_history_plan_orders", SPOT, TRADE, "history-plan-order", GET,
+             ("symbol", "startTime", "endTime"),
+             ("limit",)),
+    Endpoint("spot_batch_cancel_plan_order", SPOT, TRADE, "batch-cancel-plan-order", POST,
+             (),
+             ("symbolList",)),
+
+    # ########################################
+    # ############# SPOT ACCOUNT #############
+    # ########################################
+    Endpoint("spot_get_account_info", SPOT, ACCOUNT, "info", GET,
+             (),
+             ()),
+    Endpoint("spot_get_account_assets", SPOT, ACCOUNT, "assets", GET,
+             (),
+             ("coin", "assetType")),
+    Endpoint("spot_get_sub_account_assets", SPOT, ACCOUNT, "subaccount-assets", GET,
+             (),
+             ()),
+    Endpoint("spot_modify_deposit_account", SPOT, ACCOUNT, "modify-deposit-account", POST,
+             ("accountType", "coin"),
+             ()),
+    Endpoint("spot_get_account_bills", SPOT, ACCOUNT, "bills", GET,
+             (),
+             ("coin", "groupType", "businessType", "startTime", "endTime", "limit", "idLessThan")),
+    Endpoint("spot_transfer", SPOT, WALLET, "transfer", POST,
+             ("fromType", "toType", "amount", "coin", "symbol"),
+             ("clientOid",)),
+    Endpoint("spot_get_transferable_coin_list", SPOT, WALLET, "transfer-coin-info", GET,
+             ("fromType", "toType"),
+             ()),
+    Endpoint("spot_sub_transfer", SPOT, WALLET, "subaccount-transfer", POST,
+             ("fromType", "toType", "amount", "coin", "fromUserId", "toUserId"),
+             ("symbol", "clientOid")),
+    Endpoint("spot_withdraw", SPOT, WALLET, "withdrawal", POST,
+             ("coin", "transferType", "address", "size"),
+             ("chain", "innerToType", "areaCode", "tag", "remark", "clientOid")),
+    Endpoint("spot_get_mainsub_transfer_record", SPOT, ACCOUNT, "sub-main-trans-record", GET,
+             (),
+             ("coin", "role", "subUid", "startTime", "endTime", "clientOid", "limit", "idLessThan")),
+    Endpoint("spot_get_transfer_record", SPOT, ACCOUNT, "transferRecords", GET,
+             ("coin", "fromType"),
+             ("startTime", "endTime", "clientOid", "limit", "idLessThan")),
+    Endpoint("spot_switch_BGB_deduct", SPOT, ACCOUNT, "switch-deduct", POST,
+             ("deduct",),
+             ()),
+    Endpoint("spot_get_deposit_address", SPOT, WALLET, "deposit-address", GET,
+             ("coin",),
+             ("chain", "size")),
+    Endpoint("spot_get_subaccount_deposit_address", SPOT, WALLET, "subaccount-deposit-address", GET,
+             ("subUid", "coin"),
+             ("chain", "size")),
+    Endpoint("spot_get_BGB_deduct_info", SPOT, ACCOUNT, "deduct-info", GET,
+             (),
+             ()),
+    Endpoint("spot_cancel_withdrawal", SPOT, WALLET, "cancel-withdrawal", POST,
+             ("orderId",),
+             ()),
+    Endpoint("spot_get_subaccount_deposit_records", SPOT, WALLET, "subaccount-deposit-records", GET,
+             ("subUid",),
+             ("coin", "startTime", "endTime", "idLessThan", "limit")),
+    Endpoint("spot_get_withdrawal_records", SPOT, WALLET, "withdrawal-records", GET,
+             ("startTime", "endTime"),
+             ("coin", "clientOid", "idLessThan", "orderId", "limit")),
+    Endpoint("spot_get_deposit_records", SPOT, WALLET, "deposit-records", GET,
+             ("startTime", "endTime"),
+             ("coin", "orderId", "idLessThan", "limit")),
+
+    # ########################################
+    # ############ FUTURE MARKET #############
+    # ########################################
+    Endpoint("mix_vip_fee_rate", MIX, MARKET, "vip-fee-rate", GET,
+             (),
+             ()),
+    Endpoint("mix_interest_rate_history", MIX, MARKET, "union-interest-rate-history", GET,
+             ("coin",),
+             ()),
+    Endpoint("mix_interest_exchange_rate", MIX, MARKET, "exchange-rate", GET,
+             (),
+             ()),
+    Endpoint("mix_discount_rate", MIX, MARKET, "discount-rate", GET,
+             (),
+             ()),
+    Endpoint("mix_merge_market_depth", MIX, MARKET, "merge-depth", GET,
+             ("symbol", "productType"),
+             ("precision", "limit")),
+    Endpoint("mix_ticker", MIX, MARKET, "ticker", GET,
+             ("symbol", "productType"),
+             ()),
+    Endpoint("mix_all_tickers", MIX, MARKET, "tickers", GET,
+             ("productType",),
+             ()),
+    Endpoint("mix_recent_transactions", MIX, MARKET, "fills", GET,
+             ("symbol", "productType"),
+             ("limit",)),
+    Endpoint("mix_history_transactions", MIX, MARKET, "fills-history", GET,
+             ("symbol", "productType"),
+             ("limit", "idLessThan", "startTime", "endTime")),
+    Endpoint("mix_candlestick_data", MIX, MARKET, "candles", GET,
+             ("symbol", "productType", "granularity"),
+             ("startTime", "endTime", "kLineType", "limit")),
+    Endpoint("mix_historical_candlestick", MIX, MARKET, "history-candles", GET,
+             ("symbol", "productType", "granularity"),
+             ("startTime", "endTime", "limit")),
+    Endpoint("mix_historical_index_price_candlestick", MIX, MARKET, "history-index-candles", GET,
+             ("symbol", "productType", "granularity"),
+             ("startTime", "endTime", "limit")),
+    Endpoint("mix_historical_mark_price_candlestick", MIX, MARKET, "history-mark-candles", GET,
+             ("symbol", "productType", "granularity"),
+             ("startTime", "endTime", "limit")),
+    Endpoint("mix_open_interest", MIX, MARKET, "open-interest", GET,
+             ("symbol", "productType"),
+             ()),
+    Endpoint("mix_next_funding_time", MIX, MARKET, "funding-time", GET,
+             ("symbol", "productType"),
+             ()),
+    Endpoint("mix_mark_index_market_prices", MIX, MARKET, "symbol-price", GET,
+             ("symbol", "productType"),
+             ()),
+    Endpoint("mix_historical_funding_rates", MIX, MARKET, "history-fund-rate", GET,
+             ("symbol", "productType"),
+             ("pageSize", "pageNo")),
+    Endpoint("mix_current_funding_rate", MIX, MARKET, "current-funding-rate", GET,
+             ("symbol", "productType"),
+             ()),
+    Endpoint("mix_contract_config", MIX, MARKET, "contracts", GET,
+             ("productType",),
+             ("symbol",)),
+
+    # ########################################
+    # ############ FUTURE TRADE ##############
+    # ########################################
+    Endpoint("mix_place_order", MIX, ORDER, "place-order", POST,
+             ("symbol", "productType", "marginMode", "marginCoin", "size", "side", "orderType"),
+             (
+                 "price", "tradeSide", "force", "clientOid", "reduceOnly",
+                 "presetStopSurplusPrice", "presetStopLossPrice", "priceProtect"
+             )),
+    Endpoint("mix_reversal", MIX, ORDER, "click-backhand", POST,
+             ("symbol", "marginCoin", "productType", "size"),
+             ("side", "tradeSide", "clientOid")),
+    Endpoint("mix_batch_order", MIX, ORDER, "batch-place-order", POST,
+             ("symbol", "productType", "marginMode", "marginCoin", "orderList"),
+             (
+                 "size", "side", "orderType", "price", "tradeSide", "force", "clientOid", "reduceOnly",
+                 "presetStopSurplusPrice", "presetStopLossPrice", "stpMode"
+             ),
+             batch=("orderList", 50)),
+    Endpoint("mix_modify_order", MIX, ORDER, "modify-order", POST,
+             ("symbol", "productType", "newClientOid"),
+             (
+                 "orderId", "clientOid", "newSize", "newPrice", "newPresetStopSurplusPrice",
+                 "newPresetStopLossPrice"
+             )),
+    Endpoint("mix_cancel_order", MIX, ORDER, "cancel-order", POST,
+             ("symbol", "productType"),
+             ("marginCoin", "orderId", "clientOid")),
+    Endpoint("mix_batch_cancel", MIX, ORDER, "batch-cancel-orders", POST,
+             ("productType",),
+             ("orderIdList", "orderId", "clientOid", "symbol", "marginCoin"),
+             batch=("orderIdList", 50)),
+    Endpoint("mix_flash_close_position", MIX, ORDER, "close-positions", POST,
+             ("productType",),
+             ("symbol", "holdSide")),
+    Endpoint("mix_get_order_detail", MIX, ORDER, "detail", GET,
+             ("symbol", "productType"),
+             ("orderId", "clientOid")),
+    Endpoint("mix_get_order_fill_details", MIX, ORDER, "fill-detail", GET,
+             ("productType",),
+             ("orderId", "symbol", "idLessThan", "startTime", "endTime", "limit")),
+    Endpoint("mix_get_historical_transaction_details", MIX, ORDER, "fill-history", GET,
+             ("productType",),
+             ("orderId", "symbol", "startTime", "endTime", "idLessThan", "limit")),
+    Endpoint("mix_get_pending_orders", MIX, ORDER, "orders-pending", GET,
+             ("productType",),
+             ("orderId", "clientOid", "symbol", "status", "idLessThan", "startTime", "endTime", "limit")),
+    Endpoint("mix_get_history_order", MIX, ORDER, "orders-history", GET,
+             ("productType",),
+             (
+                 "orderId", "clientOid", "symbol", "idLessThan", "orderSource", "startTime",
+                 "endTime", "limit"
+             )),
+    Endpoint("mix_cancel_all_orders", MIX, ORDER, "cancel-all-orders", POST,
+             ("productType",),
+             ("symbol", "marginCoin", "requestTime", "receiveWindow")),
+
+    # ########################################
+    # ########### FUTURE TRIGGER #############
+    # ########################################
+    Endpoint("mix_trigger_sub_order", MIX, ORDER, "plan-sub-order", GET,
+             ("planType", "planOrderId", "productType"),
+             ()),
+    Endpoint("mix_stop_profit_and_stop_loss_plan_orders", MIX, ORDER, "place-tpsl-order", POST,
+             ("marginCoin", "productType", "symbol", "clientOid", "stpMode"),
+             (
+                 "triggerType", "executePrice", "rangeRate", "triggerBy", "triggerTime",
+                 "orderSource", "orderTime"
+             )),
+    Endpoint("mix_place_trigger_order", MIX, ORDER, "place-plan-order", POST,
+             (
+                 "planType", "symbol", "productType", "marginMode", "marginCoin", "size",
+                 "triggerPrice", "triggerType", "side", "orderType"
+             ),
+             (
+                 "price", "callbackRatio", "tradeSide", "clientOid", "reduceOnly",
+                 "stopSurplusTriggerPrice", "stopSurplusExecutePrice", "stopSurplusTriggerType",
+                 "stopLossTriggerPrice", "stopLossExecutePrice", "stopLossTriggerType", "stpMode"
+             )),
+    Endpoint("mix_modify_stop_profit_and_stop_loss_plan_order", MIX, ORDER, "modify-tpsl-order", POST,
+             ("marginCoin", "productType", "symbol", "triggerPrice", "size"),
+             ("orderId", "clientOid", "triggerType", "executePrice", "rangeRate")),
+    Endpoint("mix_modify_trigger_order", MIX, ORDER, "modify-plan-order", POST,
+             ("productType",),
+             (
+                 "orderId", "clientOid", "newSize", "newPrice", "newCallbackRatio",
+                 "newTriggerPrice", "newTriggerType", "newStopSurplusTriggerPrice",
+                 "newStopSurplusExecutePrice", "newStopSurplusTriggerType",
+                 "newStopLossTriggerPrice", "newStopLossExecutePrice", "newStopLossTriggerType"
+             )),
+    Endpoint("mix_get_pending_trigger_order", MIX, ORDER, "orders-plan-pending", GET,
+             ("planType", "productType"),
+             ("orderId", "clientOid", "symbol", "idLessThan", "startTime", "endTime", "limit")),
+    Endpoint("mix_cancel_trigger_order", MIX, ORDER, "cancel-plan-order", POST,
+             ("productType",),
+             ("orderIdList", "orderId", "clientOid", "symbol", "marginCoin", "planType")),
+    Endpoint("mix_get_history_trigger_order", MIX, ORDER, "orders-plan-history", GET,
+             ("planType", "productType"),
+             ("orderId", "clientOid", "planStatus", "symbol", "idLessThan", "startTime", "endTime", "limit")),
+
+    # ########################################
+    # ########### FUTURE ACCOUNT #############
+    # ########################################
+    Endpoint("mix_get_single_account", MIX, ACCOUNT, "account", GET,
+             ("symbol", "productType", "marginCoin"),
+             ()),
+    Endpoint("mix_get_account_list", MIX, ACCOUNT, "accounts", GET,
+             ("productType",),
+             ()),
+    Endpoint("mix_get_subaccount_assets", MIX, ACCOUNT, "sub-account-assets", GET,
+             ("productType",),
+             ()),
+    Endpoint("mix_get_USDTM_futures_interest_history", MIX, ACCOUNT, "interest-history", GET,
+             ("productType",),
+             ("coin", "idLessThan", "startTime", "endTime", "limit")),
+    Endpoint("mix_my_estimated_open_count", MIX, ACCOUNT, "open-count", GET,
+             ("symbol", "productType", "marginCoin", "openAmount", "openPrice"),
+             ("leverage",)),
+    Endpoint("mix_set_isolated_position_auto_margin", MIX, ACCOUNT, "set-auto-margin", POST,
+             ("symbol", "autoMargin", "marginCoin"),
+             ("holdSide", "amount")),
+    Endpoint("mix_change_leverage", MIX, ACCOUNT, "set-leverage", POST,
+             ("symbol", "productType", "marginCoin", "leverage"),
+             ("holdSide",)),
+    Endpoint("mix_adjust_position_margin", MIX, ACCOUNT, "set-margin", POST,
+             ("symbol", "productType", "marginCoin", "holdSide", "amount"),
+             ()),
+    Endpoint("mix_set_USDTM_futures_asset_mode", MIX, ACCOUNT, "set-asset-mode", POST,
+             ("productType", "assetMode"),
+             ()),
+    Endpoint("mix_change_margin_mode", MIX, ACCOUNT, "set-margin-mode", POST,
+             ("symbol", "productType", "marginCoin", "marginMode"),
+             ()),
+    Endpoint("mix_change_position_mode", MIX, ACCOUNT, "set-position-mode", POST,
+             ("productType", "posMode"),
+             ()),
+    Endpoint("mix_get_account_bills", MIX, ACCOUNT, "bill", GET,
+             ("productType",),
+             ("coin", "businessType", "idLessThan", "startTime", "endTime", "limit")),
+
+    # ########################################
+    # ########### FUTURE POSITION ############
+    # ########################################
+    Endpoint("mix_position_tier", MIX, MARKET, "query-position-lever", GET,
+             ("productType", "symbol"),
+             ()),
+    Endpoint("mix_single_position", MIX, POSITION, "single-position", GET,
+             ("productType", "symbol", "marginCoin"),
+             ()),
+    Endpoint("mix_all_positions", MIX, POSITION, "all-position", GET,
+             ("productType",),
+             ("marginCoin",)),
+    Endpoint("mix_historical_position", MIX, POSITION, "history-position", GET,
+             (),
+             ("symbol", "productType", "idLessThan", "startTime", "endTime", "limit")),
+)}
@@ -0,0 +1,31 @@
+class BitgetAPIException(Exception):
+
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.payload = payload
+
+        # Keep the decoded body so callers never parse the response again
+        if isinstance(payload, dict):
+            self.code = payload.get("code")
+            self.msg = payload.get("msg")
+        else:
+            self.code = None
+            self.msg = None
+
+        super().__init__(f"API Request Error: status code ({status_code}): {payload}")
+
+class BitgetRateLimitException(Exception):
+
+    def __init__(self, key, retry_after):
+        self.key = key
+        self.retry_after = retry_after
+
+        super().__init__(f"Rate limit exceeded for '{key}', retry after {retry_after:.3f}s")
+
+class BitgetWebsocketException(Exception):
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.code = payload.get("code") if isinstance(payload, dict) else None
+
+        super().__init__(f"Websocket Error: {payload}")
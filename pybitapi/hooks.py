@@ -0,0 +1,82 @@
+import threading
+from time import perf_counter
+
+HOOK_EVENTS = ("pre_request", "post_response", "on_error")
+
+class RequestEvent():
+    
+    # One network attempt as seen by the hooks, retries produce a new event each
+    __slots__ = ("endpoint", "method", "params", "status", "request_size", "response_size", "timings", "error", "started", "elapsed", "_metrics", "_last")
+    
+    def __init__(self, endpoint, method, params, metrics=None):
+        self.endpoint = endpoint
+        self.method = method
+        self.params = params
+        self.status = None
+        self.request_size = 0
+        self.response_size = 0
+        self.timings = {}
+        self.error = None
+        self.elapsed = None
+        self._metrics = metrics
+        self.started = self._last = perf_counter()
+    
+    def mark(self, phase):
+        # Same interface as metrics.PhaseTimer, so it can stand in for it in _prepare_request
+        now = perf_counter()
+        seconds = now - self._last
+        self.timings[phase] = seconds
+        if self._metrics is not None:
+            self._metrics.observe(self.endpoint, phase, seconds)
+        self._last = now
+    
+    def finish(self):
+        self.elapsed = perf_counter() - self.started
+
+class Hooks():
+    
+    def __init__(self):
+        self.pre_request = []
+        self.post_response = []
+        self.on_error = []
+        self._lock = threading.Lock()
+        self._errors = 0
+    
+    def __bool__(self):
+        return bool(self.pre_request or self.post_response or self.on_error)
+    
+    def _callbacks(self, event):
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Unknown hook event '{event}', expected one of {', '.join(HOOK_EVENTS)}.")
+        return getattr(self, event)
+    
+    def register(self, event, callback):
+        
+        # Copy on write, so emit can iterate without holding the lock
+        with self._lock:
+            setattr(self, event, self._callbacks(event) + [callback])
+        return callback
+    
+    def unregister(self, event, callback):
+        with self._lock:
+            callbacks = list(self._callbacks(event))
+            callbacks.remove(callback)
+            setattr(self, event, callbacks)
+    
+    def emit(self, callbacks, event):
+        
+        # A failing hook must not fail the request it observes
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:
+                with self._lock:
+                    self._errors += 1
+    
+    def stats(self):
+        return {
+            "pre_request": len(self.pre_request),
+            "post_response": len(self.post_response),
+            "on_error": len(self.on_error),
+            "errors": self._errors,
+        }
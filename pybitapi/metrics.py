@@ -0,0 +1,97 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Upper bounds in seconds, from signing-sized work up to slow network calls
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Phases in request order
+PHASES = ("validate", "throttle", "query", "encode", "sign", "network", "decode")
+
+class Histogram():
+    
+    __slots__ = ("counts", "sum", "count")
+    
+    def __init__(self, size):
+        # One slot per bucket plus the +Inf overflow
+        self.counts = [0] * (size + 1)
+        self.sum = 0.0
+        self.count = 0
+
+class PhaseTimer():
+    
+    # Records the time since the previous mark under each phase name
+    __slots__ = ("metrics", "key", "last")
+    
+    def __init__(self, metrics, key):
+        self.metrics = metrics
+        self.key = key
+        self.last = perf_counter()
+    
+    def mark(self, phase):
+        now = perf_counter()
+        self.metrics.observe(self.key, phase, now - self.last)
+        self.last = now
+
+class Metrics():
+    
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._histograms = {}
+        self._lock = threading.Lock()
+    
+    def timer(self, key):
+        return PhaseTimer(self, key)
+    
+    def observe(self, key, phase, seconds):
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get((key, phase))
+            if histogram is None:
+                histogram = self._histograms[(key, phase)] = Histogram(len(self.buckets))
+            histogram.counts[index] += 1
+            histogram.sum += seconds
+            histogram.count += 1
+    
+    def snapshot(self):
+        # {endpoint: {phase: {"count", "sum", "mean", "buckets": [(le, cumulative count), ...]}}}
+        with self._lock:
+            items = [(key, phase, list(histogram.counts), histogram.sum, histogram.count) for (key, phase), histogram in self._histograms.items()]
+        
+        result = {}
+        for key, phase, counts, total, count in items:
+            cumulative = 0
+            buckets = []
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                buckets.append((bound, cumulative))
+            result.setdefault(key, {})[phase] = {"count": count, "sum": total, "mean": total / count if count else 0.0, "buckets": buckets}
+        
+        return result
+    
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+    
+    def to_prometheus(self, name="pybitapi_request_phase_seconds"):
+        lines = [
+            f"# HELP {name} Time spent in each phase of a Bitget API request.",
+            f"# TYPE {name} histogram",
+        ]
+        
+        snapshot = self.snapshot()
+        for key in sorted(snapshot):
+            phases = snapshot[key]
+            for phase in sorted(phases, key=lambda phase: PHASES.index(phase) if phase in PHASES else len(PHASES)):
+                histogram = phases[phase]
+                labels = f'endpoint="{key}",phase="{phase}"'
+                for bound, count in histogram["buckets"]:
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram['sum']!r}")
+                lines.append(f"{name}_count{{{labels}}} {histogram['count']}")
+        
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,230 @@
+import asyncio
+import inspect
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+
+class _BookSide():
+    
+    # Prices are kept ascending in a compact double array, bids read it from the end.
+    # Finding a level is O(log n), adding or removing one shifts the tail of the arrays (an O(n) memmove,
+    # cheap at the few hundred levels a books channel carries), changing a size is O(1).
+    def __init__(self, descending):
+        self.descending = descending
+        self.prices = array("d")
+        self.sizes = array("d")
+        
+        # Venue strings of each level, only needed to rebuild the checksum
+        self.raw = {}
+    
+    def clear(self):
+        del self.prices[:]
+        del self.sizes[:]
+        self.raw.clear()
+    
+    def __len__(self):
+        return len(self.prices)
+    
+    def update(self, price_str, size_str):
+        price = float(price_str)
+        size = float(size_str)
+        index = bisect_left(self.prices, price)
+        exists = index < len(self.prices) and self.prices[index] == price
+        
+        if size == 0:
+            if exists:
+                del self.prices[index]
+                del self.sizes[index]
+                self.raw.pop(price, None)
+            return
+        
+        if exists:
+            self.sizes[index] = size
+        else:
+            self.prices.insert(index, price)
+            self.sizes.insert(index, size)
+        # Kept as the venue sent them, numeric REST levels (mix merge-depth) are stringified for the checksum
+        self.raw[price] = (str(price_str), str(size_str))
+    
+    def best(self):
+        if not self.prices:
+            return None
+        index = -1 if self.descending else 0
+        return self.prices[index], self.sizes[index]
+    
+    def top(self, levels):
+        # Best first, as array slices
+        if self.descending:
+            start = max(len(self.prices) - levels, 0)
+            return self.prices[start:][::-1], self.sizes[start:][::-1]
+        return self.prices[:levels], self.sizes[:levels]
+    
+    def size_to(self, price):
+        # Total size of the levels at or better than price
+        if self.descending:
+            return sum(self.sizes[bisect_left(self.prices, price):])
+        return sum(self.sizes[:bisect_right(self.prices, price)])
+    
+    def raw_top(self, levels):
+        prices, _ = self.top(levels)
+        return [self.raw[price] for price in prices]
+
+class LocalOrderBook():
+    
+    def __init__(self, snapshot=None, checksum_levels=25, resubscribe=None):
+        
+        # Preferred recovery: callable resubscribing the books channel, the venue answers with a fresh snapshot,
+        # e.g. lambda: ws.resubscribe("books", "BTCUSDT")
+        self.resubscribe = resubscribe
+        
+        # Fallback: callable returning a REST depth response, e.g. lambda: client.spot_orderbook_depth(symbol="BTCUSDT")
+        self.snapshot = snapshot
+        self.checksum_levels = checksum_levels
+        
+        self.bids = _BookSide(descending=True)
+        self.asks = _BookSide(descending=False)
+        self.seq = None
+        self.ts = None
+        self.resyncs = 0
+        self.resync_error = None
+        
+        # Updates are dropped while a resync is pending
+        self.resyncing = False
+    
+    def apply_snapshot(self, bids, asks, seq=None, ts=None):
+        self.bids.clear()
+        self.asks.clear()
+        for price, size, *_ in bids:
+            self.bids.update(price, size)
+        for price, size, *_ in asks:
+            self.asks.update(price, size)
+        
+        # A snapshot without seq (REST) keeps the last one seen, so older deltas stay stale
+        if seq is not None:
+            self.seq = seq
+        self.ts = ts
+        self.resyncing = False
+    
+    def apply_update(self, bids, asks, checksum=None, seq=None, ts=None):
+        # Returns False when the update was stale or the book had to be rebuilt
+        if self.resyncing:
+            return False
+        if seq is not None and self.seq is not None and seq <= self.seq:
+            return False
+        
+        for price, size, *_ in bids:
+            self.bids.update(price, size)
+        for price, size, *_ in asks:
+            self.asks.update(price, size)
+        if seq is not None:
+            self.seq = seq
+        self.ts = ts
+        
+        # Checks stay on after a REST snapshot, a mismatch simply resyncs again. Numeric REST levels may not
+        # reproduce the venue's strings, then every checked update resyncs until a websocket snapshot arrives,
+        # at the pace the client's rate limiter allows for the depth endpoint
+        if checksum is not None and checksum != self.checksum():
+            self.resync()
+            return False
+        
+        return True
+    
+    def on_message(self, message):
+        # Websocket books channel message
+        for data in message["data"]:
+            seq = data.get("seq")
+            ts = data.get("ts")
+            if message.get("action") == "snapshot":
+                self.apply_snapshot(data.get("bids", []), data.get("asks", []), seq, ts)
+            else:
+                self.apply_update(data.get("bids", []), data.get("asks", []), data.get("checksum"), seq, ts)
+    
+    def resync(self):
+        if self.resubscribe is None and self.snapshot is None:
+            raise ValueError("Order book is out of sync and no snapshot source was given.")
+        
+        self.resyncing = True
+        self.resyncs += 1
+        
+        if self.resubscribe is not None:
+            result = self.resubscribe()
+            if inspect.isawaitable(result):
+                asyncio.ensure_future(result)
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._apply_rest_snapshot(self.snapshot())
+            return
+        
+        # Called from a websocket callback, the blocking REST call must not stall the event loop
+        loop.run_in_executor(None, self.snapshot).add_done_callback(self._on_rest_snapshot)
+    
+    def _on_rest_snapshot(self, future):
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is not None:
+            
+            # The next checksum mismatch tries again
+            self.resync_error = error
+            self.resyncing = False
+            return
+        
+        self._apply_rest_snapshot(future.result())
+    
+    def _apply_rest_snapshot(self, response):
+        data = response["data"]
+        self.apply_snapshot(data.get("bids", []), data.get("asks", []), ts=data.get("ts"))
+        self.resync_error = None
+    
+    def checksum(self):
+        # CRC32 over the top levels as bid:size:ask:size... using the venue's own strings, as a signed int
+        bids = self.bids.raw_top(self.checksum_levels)
+        asks = self.asks.raw_top(self.checksum_levels)
+        
+        parts = []
+        for index in range(max(len(bids), len(asks))):
+            if index < len(bids):
+                parts.extend(bids[index])
+            if index < len(asks):
+                parts.extend(asks[index])
+        
+        crc = zlib.crc32(":".join(parts).encode("utf-8"))
+        return crc - (1 << 32) if crc >= 1 << 31 else crc
+    
+    # ########################################
+    # ############### QUERIES ################
+    # ########################################
+    
+    def best_bid(self):
+        return self.bids.best()
+    
+    def best_ask(self):
+        return self.asks.best()
+    
+    def mid_price(self):
+        bid = self.bids.best()
+        ask = self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+    
+    def spread(self):
+        bid = self.bids.best()
+        ask = self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+    
+    def depth(self, levels):
+        # (bid prices, bid sizes, ask prices, ask sizes), best first
+        return self.bids.top(levels) + self.asks.top(levels)
+    
+    def bid_size_to(self, price):
+        return self.bids.size_to(price)
+    
+    def ask_size_to(self, price):
+        return self.asks.size_to(price)
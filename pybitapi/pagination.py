@@ -0,0 +1,88 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Record field holding the cursor for endpoints whose data is a plain list,
+# endpoints returning an object carry it in "endId" (or "idLessThan") instead
+CURSOR_FIELDS = {
+    "spot_market_trades": "tradeId",
+    "spot_current_orders": "orderId",
+    "spot_history_orders": "orderId",
+    "spot_fills": "tradeId",
+    "spot_get_account_bills": "billId",
+    "spot_get_mainsub_transfer_record": "transferId",
+    "spot_get_transfer_record": "transferId",
+    "spot_get_subaccount_deposit_records": "orderId",
+    "spot_get_withdrawal_records": "orderId",
+    "spot_get_deposit_records": "orderId",
+    "mix_history_transactions": "tradeId",
+}
+
+def is_paginated(endpoint):
+    return "idLessThan" in endpoint.optional
+
+def parse_page(data, cursor_field=None):
+    # Returns the page records and the cursor of the next page, None when this was the last one
+    if isinstance(data, dict):
+        records = next((value for value in data.values() if isinstance(value, list)), [])
+        cursor = data.get("endId") or data.get("idLessThan")
+        if data.get("nextFlag") is False:
+            cursor = None
+    else:
+        records = data or []
+        cursor = records[-1].get(cursor_field) if records and cursor_field else None
+    
+    if not records:
+        cursor = None
+    
+    return records, cursor
+
+def paginate(fetch, params, cursor_field=None, prefetch=False):
+    params = dict(params)
+    
+    # With prefetch the next page is requested before the current one is handed to the caller
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    
+    try:
+        response = fetch(**params)
+        while response is not None:
+            records, cursor = parse_page(response["data"], cursor_field)
+            
+            future = None
+            has_next = cursor is not None and cursor != params.get("idLessThan")
+            if has_next:
+                params["idLessThan"] = cursor
+                if executor:
+                    future = executor.submit(fetch, **params)
+            
+            yield from records
+            
+            response = None
+            if has_next:
+                response = future.result() if future else fetch(**params)
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+async def apaginate(fetch, params, cursor_field=None, prefetch=False):
+    params = dict(params)
+    task = asyncio.ensure_future(fetch(**params))
+    
+    try:
+        while task is not None:
+            records, cursor = parse_page((await task)["data"], cursor_field)
+            
+            task = None
+            has_next = cursor is not None and cursor != params.get("idLessThan")
+            if has_next:
+                params["idLessThan"] = cursor
+                if prefetch:
+                    task = asyncio.ensure_future(fetch(**params))
+            
+            for record in records:
+                yield record
+            
+            if has_next and not prefetch:
+                task = asyncio.ensure_future(fetch(**params))
+    finally:
+        if task is not None:
+            task.cancel()
@@ -0,0 +1,123 @@
+import threading
+import time
+from pybitapi.exceptions import BitgetRateLimitException
+
+# Requests per second per UID, keyed by endpoint path without the version prefix
+DEFAULT_RATE_LIMITS = {
+    "spot/public/coins": 3,
+    "spot/public/symbols": 20,
+    "spot/market/tickers": 20,
+    "spot/market/orderbook": 20,
+    "spot/market/merge-depth": 20,
+    "spot/market/candles": 20,
+    "spot/market/history-candles": 20,
+    "spot/market/fills": 10,
+    "spot/market/fills-history": 10,
+    "spot/trade/place-order": 10,
+    "spot/trade/batch-orders": 5,
+    "spot/trade/batch-cancel-order": 10,
+    "spot/wallet/withdrawal": 5,
+    "mix/market/ticker": 20,
+    "mix/market/tickers": 20,
+    "mix/market/merge-depth": 20,
+    "mix/market/candles": 20,
+    "mix/market/history-candles": 20,
+    "mix/market/contracts": 20,
+    "mix/order/place-order": 10,
+    "mix/order/batch-place-order": 5,
+    "mix/order/batch-cancel-orders": 10,
+    "mix/position/all-position": 5,
+}
+
+class TokenBucket():
+    
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def reserve(self):
+        # Takes a token, borrowing from the future if needed, and returns the seconds to wait for it
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def try_acquire(self):
+        # Takes a token only if one is available now, otherwise returns the seconds until one is
+        with self._lock:
+            self._refill(time.monotonic())
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+class RateLimiter():
+    
+    def __init__(self, default_rate=10, limits=None, block=True):
+        self.default_rate = default_rate
+        self.limits = dict(DEFAULT_RATE_LIMITS)
+        self.limits.update(limits or {})
+        self.block = block
+        
+        self._buckets = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+    
+    def _bucket(self, key):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = TokenBucket(self.limits.get(key, self.default_rate))
+                    self._stats[key] = {"requests": 0, "throttled": 0, "rejected": 0, "wait_time": 0.0, "max_wait": 0.0}
+        return bucket
+    
+    def reserve(self, key):
+        bucket = self._bucket(key)
+        
+        # Fail-fast mode raises instead of waiting
+        if not self.block:
+            retry_after = bucket.try_acquire()
+            with self._lock:
+                stats = self._stats[key]
+                if retry_after:
+                    stats["rejected"] += 1
+                else:
+                    stats["requests"] += 1
+            if retry_after:
+                raise BitgetRateLimitException(key, retry_after)
+            return 0.0
+        
+        delay = bucket.reserve()
+        with self._lock:
+            stats = self._stats[key]
+            stats["requests"] += 1
+            if delay:
+                stats["throttled"] += 1
+                stats["wait_time"] += delay
+                stats["max_wait"] = max(stats["max_wait"], delay)
+        
+        return delay
+    
+    def acquire(self, key):
+        delay = self.reserve(key)
+        if delay:
+            time.sleep(delay)
+        return delay
+    
+    def stats(self):
+        with self._lock:
+            return {key: dict(stats) for key, stats in self._stats.items()}
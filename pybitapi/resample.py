@@ -0,0 +1,91 @@
+from pybitapi.candles import concat_candles, empty_candles, granularity_to_ms, is_utc8_aligned, np, require_numpy
+
+WEEK = 604800000
+
+# The epoch was a Thursday, weekly bars start on Monday 00:00 UTC
+MONDAY_OFFSET = 345600000
+
+# UTC+8 midnight is 16:00 UTC the day before
+UTC8_OFFSET = -28800000
+
+def default_offset(granularity):
+    # Bucket alignment the venue uses for its own bars of this granularity
+    period = granularity_to_ms(granularity)
+    offset = MONDAY_OFFSET if period % WEEK == 0 else 0
+    if is_utc8_aligned(granularity):
+        offset += UTC8_OFFSET
+    return offset % period
+
+def bucket_starts(ts, period, offset=None):
+    if offset is None:
+        offset = MONDAY_OFFSET if period % WEEK == 0 else 0
+    return (ts - offset) // period * period + offset
+
+def resample(candles, granularity, offset=None):
+    require_numpy()
+    if not len(candles):
+        return empty_candles()
+    
+    if offset is None:
+        offset = default_offset(granularity)
+    buckets = bucket_starts(candles["ts"], granularity_to_ms(granularity), offset)
+    
+    # Index of the first and last source bar of every bucket, input is in time order
+    first = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    last = np.r_[first[1:] - 1, len(candles) - 1]
+    
+    bars = empty_candles(len(first))
+    bars["ts"] = buckets[first]
+    bars["open"] = candles["open"][first]
+    bars["close"] = candles["close"][last]
+    bars["high"] = np.maximum.reduceat(candles["high"], first)
+    bars["low"] = np.minimum.reduceat(candles["low"], first)
+    bars["base_volume"] = np.add.reduceat(candles["base_volume"], first)
+    bars["quote_volume"] = np.add.reduceat(candles["quote_volume"], first)
+    
+    return bars
+
+def resample_all(candles, granularities, offset=None):
+    return {granularity: resample(candles, granularity, offset) for granularity in granularities}
+
+class Resampler():
+    
+    # Incrementally builds one higher granularity from a stream of source bars,
+    # the source bars of the still open bucket are the only state kept
+    def __init__(self, granularity, source_granularity="1min", offset=None):
+        require_numpy()
+        self.granularity = granularity
+        self.period = granularity_to_ms(granularity)
+        self.step = granularity_to_ms(source_granularity)
+        self.offset = default_offset(granularity) if offset is None else offset
+        
+        self._pending = empty_candles()
+    
+    def update(self, candles):
+        # Returns the bars closed by this update and the current partial bar (empty or one row)
+        if len(candles):
+            
+            # A re-sent source bar replaces the stored one, e.g. the still forming last minute
+            pending = self._pending[self._pending["ts"] < candles["ts"][0]]
+            candles = concat_candles([pending, candles])
+        else:
+            candles = self._pending
+        
+        if not len(candles):
+            return empty_candles(), empty_candles()
+        
+        buckets = bucket_starts(candles["ts"], self.period, self.offset)
+        
+        # The last bucket stays open until its final source bar has been seen
+        open_from = buckets[-1]
+        if candles["ts"][-1] + self.step >= open_from + self.period:
+            open_from = open_from + self.period
+        
+        closed = buckets < open_from
+        self._pending = candles[~closed]
+        
+        return resample(candles[closed], self.granularity, self.offset), resample(self._pending, self.granularity, self.offset)
+    
+    @property
+    def partial(self):
+        return resample(self._pending, self.granularity, self.offset)
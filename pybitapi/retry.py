@@ -0,0 +1,56 @@
+import random
+import time
+from pybitapi.exceptions import BitgetAPIException
+from pybitapi.variables import *
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+class RetryPolicy():
+    
+    def __init__(self, max_attempts=4, backoff=0.1, max_backoff=2.0, deadline=10.0, status_codes=RETRYABLE_STATUS_CODES):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.status_codes = frozenset(status_codes)
+    
+    def is_idempotent(self, method, data):
+        if method == GET:
+            return True
+        
+        # A POST is only replayed when its clientOid lets the exchange reject the duplicate
+        if data.get("clientOid"):
+            return True
+        
+        order_list = data.get("orderList")
+        if order_list:
+            return all(isinstance(order, dict) and order.get("clientOid") for order in order_list)
+        
+        return False
+    
+    def is_retryable(self, error, connection_errors):
+        if isinstance(error, BitgetAPIException):
+            return error.status_code in self.status_codes
+        return isinstance(error, connection_errors)
+    
+    def attempt_timeout(self, started, timeout):
+        # Per-attempt timeout, capped at what is left of the total deadline
+        if self.deadline is None:
+            return timeout
+        
+        remaining = max(self.deadline - (time.monotonic() - started), 0.001)
+        return remaining if timeout is None else min(timeout, remaining)
+    
+    def retry_delay(self, error, attempt, started, connection_errors):
+        # Returns the seconds to sleep before the next attempt, or None to give up
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(error, connection_errors):
+            return None
+        
+        # Exponential backoff with full jitter
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        
+        # Never sleep past the total deadline
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return None
+        
+        return delay
@@ -0,0 +1,218 @@
+import asyncio
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+from pybitapi.variables import *
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+class _Counters():
+    
+    # Cumulative, so they survive pools being dropped or replaced
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.created = 0
+        self.reused = 0
+        self.idle_closed = 0
+    
+    def add(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_created": self.created,
+                "connections_reused": self.reused,
+                "idle_closed": self.idle_closed,
+            }
+
+class _CountingConnection():
+    
+    counters = None
+    
+    def connect(self):
+        super().connect()
+        if self.counters is not None:
+            self.counters.add("created")
+
+class _HTTPConnection(_CountingConnection, HTTPConnection):
+    pass
+
+class _HTTPSConnection(_CountingConnection, HTTPSConnection):
+    pass
+
+class _TrackingPool():
+    
+    # Set by _PoolManager for every pool it creates
+    counters = None
+    keep_alive_timeout = None
+    
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.counters = self.counters
+        return conn
+    
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        if getattr(conn, "sock", None) is None:
+            return conn
+        
+        # Close connections idle for longer than the server most likely keeps them, the next request reconnects
+        released = getattr(conn, "released_at", None)
+        if self.keep_alive_timeout is not None and released is not None and time.monotonic() - released > self.keep_alive_timeout:
+            conn.close()
+            self.counters.add("idle_closed")
+        else:
+            self.counters.add("reused")
+        return conn
+    
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.released_at = time.monotonic()
+        super()._put_conn(conn)
+
+class _HTTPPool(_TrackingPool, HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+class _HTTPSPool(_TrackingPool, HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+class _PoolManager(PoolManager):
+    
+    def __init__(self, counters, keep_alive_timeout, **kwargs):
+        super().__init__(**kwargs)
+        self.counters = counters
+        self.keep_alive_timeout = keep_alive_timeout
+        self.pool_classes_by_scheme = {"http": _HTTPPool, "https": _HTTPSPool}
+    
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.counters = self.counters
+        pool.keep_alive_timeout = self.keep_alive_timeout
+        return pool
+
+class _Adapter(HTTPAdapter):
+    
+    def __init__(self, counters, keep_alive_timeout, **kwargs):
+        self.counters = counters
+        self.keep_alive_timeout = keep_alive_timeout
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _PoolManager(self.counters, self.keep_alive_timeout, num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs)
+
+class Session():
+
+    # Transport failures the retry policy treats as transient
+    connection_errors = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive_timeout=30):
+
+        # Seconds a pooled connection may sit idle before it is closed instead of reused, None keeps it forever
+        self.keep_alive_timeout = keep_alive_timeout
+        self._counters = _Counters()
+
+        # One adapter serves every host, so the pooled connections are shared by all endpoint methods
+        self._adapter = _Adapter(self._counters, keep_alive_timeout, pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+    def request(self, method, url, body, header, timeout=None):
+        self._counters.add("requests")
+        
+        if method == GET:
+            response = self._session.get(url, headers=header, timeout=timeout)
+        elif method == POST:
+            response = self._session.post(url, data=body, headers=header, timeout=timeout)
+
+        return response.status_code, response.content
+
+    def stats(self):
+        return self._counters.snapshot()
+
+    def close(self):
+        self._session.close()
+
+class AsyncSession():
+
+    connection_errors = (aiohttp.ClientConnectionError, asyncio.TimeoutError) if aiohttp is not None else ()
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive_timeout=30):
+
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires the 'aiohttp' package, install it with 'pip install aiohttp'.")
+
+        # aiohttp always waits for a free connection once the limit is reached, so pool_block has no effect here
+        self.limit = pool_connections * pool_maxsize
+        self.limit_per_host = pool_maxsize
+        self.keep_alive_timeout = keep_alive_timeout
+
+        # The aiohttp session must be created inside the running event loop
+        self._session = None
+        self._requests = 0
+        self._created = 0
+        self._reused = 0
+
+    async def _on_connection_create(self, session, context, params):
+        self._created += 1
+
+    async def _on_connection_reuse(self, session, context, params):
+        self._reused += 1
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_create)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+
+            connector_params = {"limit": self.limit, "limit_per_host": self.limit_per_host}
+            if self.keep_alive_timeout is not None:
+                connector_params["keepalive_timeout"] = self.keep_alive_timeout
+
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(**connector_params), trace_configs=[trace_config])
+
+        return self._session
+
+    async def request(self, method, url, body, header, timeout=None):
+        session = self._get_session()
+        self._requests += 1
+
+        # The total timeout covers connecting, sending and reading the whole body
+        params = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout is not None else {}
+        async with session.request(method, url, data=body or None, headers=header, **params) as response:
+            return response.status, await response.read()
+
+    def stats(self):
+        idle = 0
+        in_use = 0
+
+        if self._session is not None and not self._session.closed:
+            connector = self._session.connector
+            idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+            in_use = len(getattr(connector, "_acquired", ()))
+
+        return {
+            "requests": self._requests,
+            "connections_created": self._created,
+            "connections_reused": self._reused,
+            "idle_connections": idle,
+            "active_connections": in_use,
+        }
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
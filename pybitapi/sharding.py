@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+from pybitapi.pagination import CURSOR_FIELDS, parse_page
+
+TIME_FIELDS = ("cTime", "ts", "uTime", "createTime")
+ID_FIELDS = ("tradeId", "orderId", "billId", "transferId", "id")
+
+def split_time_range(start, end, window):
+    # Windows share their boundary timestamp, duplicates are removed when merging
+    windows = []
+    while start < end:
+        windows.append((start, min(start + window, end)))
+        start += window
+    return windows
+
+def _first_field(record, fields):
+    return next((field for field in fields if field in record), None)
+
+def merge_records(pages, time_field=None, id_field=None, reverse=False):
+    records = [record for page in pages for record in page]
+    if not records:
+        return records
+    
+    time_field = time_field or _first_field(records[0], TIME_FIELDS)
+    id_field = id_field or _first_field(records[0], ID_FIELDS)
+    
+    seen = set()
+    unique = []
+    for record in records:
+        key = record.get(id_field) if id_field else tuple(sorted(record.items()))
+        if key not in seen:
+            seen.add(key)
+            unique.append(record)
+    
+    if time_field:
+        unique.sort(key=lambda record: int(record.get(time_field) or 0), reverse=reverse)
+    
+    return unique
+
+def _fetch_window(client, name, params):
+    # Paginated endpoints are walked to the end of each window
+    iterator = getattr(client, "iter_" + name, None)
+    if iterator is not None:
+        return list(iterator(**params))
+    return parse_page(getattr(client, name)(**params)["data"])[0]
+
+def fetch_time_range(client, name, startTime, endTime, window=86400000, max_workers=8, time_field=None, id_field=None, reverse=False, **params):
+    windows = split_time_range(int(startTime), int(endTime), int(window))
+    
+    # The client's rate limiter keeps the workers within the endpoint budget
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pages = executor.map(lambda bounds: _fetch_window(client, name, dict(params, startTime=bounds[0], endTime=bounds[1])), windows)
+        return merge_records(list(pages), time_field, id_field or CURSOR_FIELDS.get(name), reverse)
+
+async def _afetch_window(client, name, params):
+    iterator = getattr(client, "iter_" + name, None)
+    if iterator is not None:
+        return [record async for record in iterator(**params)]
+    return parse_page((await getattr(client, name)(**params))["data"])[0]
+
+async def afetch_time_range(client, name, startTime, endTime, window=86400000, max_workers=8, time_field=None, id_field=None, reverse=False, **params):
+    windows = split_time_range(int(startTime), int(endTime), int(window))
+    
+    pages = await client.gather(*(_afetch_window(client, name, dict(params, startTime=start, endTime=end)) for start, end in windows), limit=max_workers)
+    return merge_records(pages, time_field, id_field or CURSOR_FIELDS.get(name), reverse)
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+class SingleFlight():
+    
+    # Concurrent calls with the same key share the result of the one that runs first,
+    # waiters get copy(result) when given so no two callers hold the same object
+    def __init__(self, copy=None):
+        self.copy = copy
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "coalesced": 0}
+    
+    def do(self, key, fn):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._stats["calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+        
+        if not leader:
+            result = future.result()
+            return self.copy(result) if self.copy is not None else result
+        
+        try:
+            result = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+    
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+class AsyncSingleFlight():
+    
+    def __init__(self, copy=None):
+        self.copy = copy
+        self._calls = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+    
+    async def do(self, key, fn):
+        task = self._calls.get(key)
+        leader = task is None
+        if leader:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+            self._stats["calls"] += 1
+        else:
+            self._stats["coalesced"] += 1
+        
+        # A cancelled waiter does not cancel the shared request
+        result = await asyncio.shield(task)
+        if leader or self.copy is None:
+            return result
+        return self.copy(result)
+    
+    def stats(self):
+        return dict(self._stats, in_flight=len(self._calls))
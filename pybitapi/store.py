@@ -0,0 +1,213 @@
+import os
+import shutil
+from pybitapi.backfill import CandleBackfill
+from pybitapi.candles import CANDLE_DTYPE, CANDLE_FIELDS, require_numpy, concat_candles, decode_candles, empty_candles, granularity_to_ms, np
+
+# Names the generation directory that holds the live column files
+CURRENT = "CURRENT"
+GENERATION_PREFIX = "gen-"
+
+class _Collector():
+    
+    # In-memory store used to fetch a range that has to be prepended
+    def __init__(self):
+        self.pages = []
+    
+    def last_timestamp(self, key):
+        return None
+    
+    def append(self, key, rows):
+        self.pages.append(decode_candles(rows) if isinstance(rows, list) else rows)
+
+def _fsync_directory(path):
+    # Persists renames and new entries, not supported on every platform
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class MmapCandleStore():
+    
+    # One directory per (symbol, productType, granularity) holding one raw little-endian file per column.
+    # The ts column is written last and defines the row count, so a crash mid-append never exposes partial rows.
+    # A prepend writes all columns into a new generation directory and switches the CURRENT file to it in one rename,
+    # the previous generation is removed by the prepend after that.
+    def __init__(self, directory):
+        require_numpy()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _key_path(self, key):
+        return os.path.join(self.directory, *key)
+    
+    def _generation(self, key):
+        # None for the initial layout with the column files directly in the key directory
+        try:
+            with open(os.path.join(self._key_path(key), CURRENT)) as file:
+                return file.read().strip() or None
+        except FileNotFoundError:
+            return None
+    
+    def _path(self, key, field=None, generation=False):
+        path = self._key_path(key)
+        if generation is False:
+            generation = self._generation(key)
+        if generation:
+            path = os.path.join(path, generation)
+        return os.path.join(path, field + ".bin") if field else path
+    
+    def keys(self):
+        for symbol in sorted(os.listdir(self.directory)):
+            for product_type in sorted(os.listdir(os.path.join(self.directory, symbol))):
+                for granularity in sorted(os.listdir(os.path.join(self.directory, symbol, product_type))):
+                    yield (symbol, product_type, granularity)
+    
+    def count(self, key, generation=False):
+        path = self._path(key, "ts", generation)
+        return os.path.getsize(path) // 8 if os.path.exists(path) else 0
+    
+    def first_timestamp(self, key):
+        ts = self.timestamps(key)
+        return int(ts[0]) if len(ts) else None
+    
+    def last_timestamp(self, key):
+        generation = self._generation(key)
+        count = self.count(key, generation)
+        if not count:
+            return None
+        
+        with open(self._path(key, "ts", generation), "rb") as file:
+            file.seek((count - 1) * 8)
+            return int(np.frombuffer(file.read(8), dtype="<i8")[0])
+    
+    def _column(self, key, field, count, generation=False):
+        if not count:
+            return np.empty(0, dtype=CANDLE_DTYPE[field])
+        return np.memmap(self._path(key, field, generation), dtype=CANDLE_DTYPE[field], mode="r", shape=(count,))
+    
+    # Every read resolves CURRENT once, so all of its columns come from the same generation
+    def timestamps(self, key):
+        generation = self._generation(key)
+        return self._column(key, "ts", self.count(key, generation), generation)
+    
+    def columns(self, key):
+        generation = self._generation(key)
+        count = self.count(key, generation)
+        return {field: self._column(key, field, count, generation) for field in CANDLE_FIELDS}
+    
+    def range(self, key, start=None, end=None):
+        # Binary search on the sorted ts column, slices of the memory maps are zero-copy views
+        generation = self._generation(key)
+        count = self.count(key, generation)
+        ts = self._column(key, "ts", count, generation)
+        
+        lo = int(np.searchsorted(ts, start, side="left")) if start is not None else 0
+        hi = int(np.searchsorted(ts, end, side="left")) if end is not None else count
+        
+        return {field: self._column(key, field, count, generation)[lo:hi] for field in CANDLE_FIELDS}
+    
+    def append(self, key, rows):
+        candles = decode_candles(rows) if isinstance(rows, list) else rows
+        
+        # Only bars after the last stored one keep the ts column sorted
+        last = self.last_timestamp(key)
+        if last is not None:
+            candles = candles[candles["ts"] > last]
+        if not len(candles):
+            return 0
+        
+        self._write(key, candles, self.count(key), "ab")
+        return len(candles)
+    
+    def _write(self, key, candles, count, mode):
+        generation = self._generation(key)
+        os.makedirs(self._path(key, generation=generation), exist_ok=True)
+        
+        for field in CANDLE_FIELDS[1:] + ("ts",):
+            path = self._path(key, field, generation)
+            
+            # Drop any tail left by an interrupted append before writing
+            if mode == "ab" and os.path.exists(path) and os.path.getsize(path) != count * 8:
+                os.truncate(path, count * 8)
+            
+            with open(path, mode) as file:
+                file.write(np.ascontiguousarray(candles[field]).tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+    
+    def _prepend(self, key, candles):
+        columns = self.columns(key)
+        count = len(columns["ts"])
+        
+        stored = empty_candles(count)
+        for field in CANDLE_FIELDS:
+            stored[field] = columns[field]
+        
+        # Rewriting is only needed when history older than the first stored bar is requested
+        merged = concat_candles([candles, stored])
+        
+        key_path = self._key_path(key)
+        old = self._generation(key)
+        
+        # Only the live generation survives from earlier prepends, the one before it and leftovers
+        # of an interrupted prepend go, and the next free number is used
+        generations = [name for name in os.listdir(key_path) if name.startswith(GENERATION_PREFIX)]
+        for name in generations:
+            if name != old:
+                shutil.rmtree(os.path.join(key_path, name), ignore_errors=True)
+        if old is not None:
+            for field in CANDLE_FIELDS:
+                path = os.path.join(key_path, field + ".bin")
+                if os.path.exists(path):
+                    os.remove(path)
+        number = max((int(name[len(GENERATION_PREFIX):]) for name in generations if name[len(GENERATION_PREFIX):].isdigit()), default=0) + 1
+        new = GENERATION_PREFIX + str(number)
+        
+        os.makedirs(os.path.join(key_path, new))
+        for field in CANDLE_FIELDS:
+            with open(self._path(key, field, new), "wb") as file:
+                file.write(np.ascontiguousarray(merged[field]).tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+        _fsync_directory(os.path.join(key_path, new))
+        
+        # Readers see either every old column or every new one
+        tmp = os.path.join(key_path, CURRENT + ".tmp")
+        with open(tmp, "w") as file:
+            file.write(new)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, os.path.join(key_path, CURRENT))
+        _fsync_directory(key_path)
+        
+        # The previous generation stays until the next prepend, so a read that resolved it just before
+        # the switch can still open its files, only a read spanning two prepends has to be retried
+        
+        return len(merged) - count
+    
+    def sync(self, client, symbol, granularity, start, end, productType=None, method=None, max_workers=8, **params):
+        if productType is not None:
+            params["productType"] = productType
+        method = method or ("mix_historical_candlestick" if productType else "spot_history_candlestick_data")
+        key = (symbol, productType or "SPOT", granularity)
+        
+        # Older history missing before the first stored bar
+        written = 0
+        first = self.first_timestamp(key)
+        if first is not None and start < first:
+            collector = _Collector()
+            CandleBackfill(client, collector, max_workers).run(symbol, granularity, start, first, method, **params)
+            written += self._prepend(key, concat_candles(collector.pages))
+        
+        # Anything after the last stored bar, the backfill resumes from it
+        last = self.last_timestamp(key)
+        if last is None or end > last + granularity_to_ms(granularity):
+            written += CandleBackfill(client, self, max_workers).run(symbol, granularity, start, end, method, **params)
+        
+        return written
@@ -1,8 +1,15 @@
 import hmac
+import hashlib
 import base64
+import json
 import time
 from pybitapi.variables import *
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def parse_params_to_str(data):
     # Sort the dictionary by key in ascending order
     sorted_data = dict(sorted(data.items()))
@@ -23,6 +30,26 @@ def sign(message, secret_key):
     dig = mac.digest()
     return base64.b64encode(dig)
 
+class Signer():
+    
+    def __init__(self, secret_key):
+        if isinstance(secret_key, str):
+            secret_key = secret_key.encode('utf-8')
+        
+        # Keyed once, each signature works on a copy of this state
+        self._mac = hmac.new(secret_key, digestmod=hashlib.sha256)
+    
+    def sign(self, message):
+        mac = self._mac.copy()
+        mac.update(message)
+        return base64.b64encode(mac.digest()).decode('ascii')
+    
+    def sign_request(self, timestamp, method, request_path, body=b""):
+        mac = self._mac.copy()
+        mac.update(b"%d%s%s" % (timestamp, method.upper().encode('ascii'), request_path.encode('utf-8')))
+        mac.update(body)
+        return base64.b64encode(mac.digest()).decode('ascii')
+
 def get_header(api_key, sign, timestamp, passphrase):
     header = dict()
     header[CONTENT_TYPE] = APPLICATION_JSON
@@ -32,4 +59,32 @@ def get_header(api_key, sign, timestamp, passphrase):
     header[ACCESS_PASSPHRASE] = passphrase
     header[LOCALE] = EN
 
-    return header
\ No newline at end of file
+    return header
+
+def get_header_template(api_key, passphrase):
+    header = dict()
+    header[CONTENT_TYPE] = APPLICATION_JSON
+    header[ACCESS_KEY] = api_key
+    header[ACCESS_PASSPHRASE] = passphrase
+    header[LOCALE] = EN
+
+    return header
+
+def fill_header(template, sign, timestamp):
+    # dict.copy reuses the stored key hashes of the static entries
+    header = template.copy()
+    header[ACCESS_SIGN] = sign
+    header[ACCESS_TIMESTAMP] = str(timestamp)
+
+    return header
+
+def json_dumps(data):
+    # Request bodies are signed and sent as bytes
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
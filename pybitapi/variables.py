@@ -103,4 +103,11 @@ COPY_mix_FOLLOWER_V2_URL = '/api/v2/copy/mix-follower'
 EARN_SAVING_V2_URL = '/api/v2/earn/savings'
 EARN_ACCOUNT_V2_URL = '/api/v2/earn/account'
 EARN_SHARKFIN_V2_URL = '/api/v2/earn/sharkfin'
-EARN_LOAN_V2_URL = '/api/v2/earn/loan'
\ No newline at end of file
+EARN_LOAN_V2_URL = '/api/v2/earn/loan'
+
+# ########################################
+# ##############【websocket url】##########
+# ########################################
+
+WS_PUBLIC_URL = 'wss://ws.bitget.com/v2/ws/public'
+WS_PRIVATE_URL = 'wss://ws.bitget.com/v2/ws/private'
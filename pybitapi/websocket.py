@@ -0,0 +1,323 @@
+import asyncio
+import inspect
+import random
+import time
+from pybitapi import utils
+from pybitapi.exceptions import BitgetWebsocketException
+from pybitapi.variables import *
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+class WebsocketClient():
+    
+    def __init__(self, url=WS_PUBLIC_URL, ping_interval=25, reconnect_delay=0.5, max_reconnect_delay=30, queue_size=10000, json_loads=None, json_dumps=None, on_error=None):
+        
+        if websockets is None:
+            raise ImportError("WebsocketClient requires the 'websockets' package, install it with 'pip install websockets'.")
+        
+        self.url = url
+        self.ping_interval = ping_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.queue_size = queue_size
+        self.json_loads = json_loads or utils.json_loads
+        self.json_dumps = json_dumps or utils.json_dumps
+        
+        # Called with (exception, message) when a frame cannot be decoded or a callback raises,
+        # the stream itself keeps running
+        self.on_error = on_error
+        self.errors = 0
+        
+        # Subscriptions survive reconnects: (instType, channel, instId) -> [arg, callbacks]
+        self._subscriptions = {}
+        
+        self._ws = None
+        self._task = None
+        self._queue = None
+        self._closed = False
+        self._connected = None
+        self._error = None
+        self._attempt = 0
+        self.reconnects = 0
+    
+    # ########################################
+    # ############ SUBSCRIPTIONS #############
+    # ########################################
+    
+    @staticmethod
+    def _key(arg):
+        return (arg.get("instType"), arg.get("channel"), arg.get("instId") or arg.get("coin"))
+    
+    async def subscribe(self, channel, instId="default", instType="SPOT", callback=None, **extra):
+        arg = {key: value for key, value in dict(extra, instType=instType, channel=channel, instId=instId).items() if value is not None}
+        
+        entry = self._subscriptions.setdefault(self._key(arg), [arg, []])
+        if callback is not None:
+            entry[1].append(callback)
+        
+        if self._ws is not None:
+            await self._send({"op": "subscribe", "args": [arg]})
+        
+        return arg
+    
+    async def unsubscribe(self, channel, instId="default", instType="SPOT", **extra):
+        arg = {key: value for key, value in dict(extra, instType=instType, channel=channel, instId=instId).items() if value is not None}
+        self._subscriptions.pop(self._key(arg), None)
+        
+        if self._ws is not None:
+            await self._send({"op": "unsubscribe", "args": [arg]})
+    
+    async def resubscribe(self, channel, instId="default", instType="SPOT", **extra):
+        # Unsubscribes and subscribes again on the live connection, the venue answers with a fresh snapshot
+        arg = {key: value for key, value in dict(extra, instType=instType, channel=channel, instId=instId).items() if value is not None}
+        
+        if self._ws is not None:
+            await self._send({"op": "unsubscribe", "args": [arg]})
+            await self._send({"op": "subscribe", "args": [arg]})
+    
+    async def subscribe_ticker(self, instId, instType="SPOT", callback=None):
+        return await self.subscribe("ticker", instId, instType, callback)
+    
+    async def subscribe_books(self, instId, instType="SPOT", depth="books", callback=None):
+        # depth is one of books, books1, books5, books15
+        return await self.subscribe(depth, instId, instType, callback)
+    
+    async def subscribe_trades(self, instId, instType="SPOT", callback=None):
+        return await self.subscribe("trade", instId, instType, callback)
+    
+    async def subscribe_candles(self, instId, granularity="1m", instType="SPOT", callback=None):
+        return await self.subscribe("candle" + granularity, instId, instType, callback)
+    
+    # ########################################
+    # ############## CONNECTION ##############
+    # ########################################
+    
+    async def start(self):
+        self._closed = False
+        self._connected = asyncio.Event()
+        self._task = asyncio.ensure_future(self.run())
+        
+        # Returns once the first connection is up and subscribed
+        await self._connected.wait()
+        if self._error is not None:
+            raise self._error
+    
+    async def wait_connected(self):
+        await self._connected.wait()
+    
+    async def close(self):
+        self._closed = True
+        if self._ws is not None:
+            await self._ws.close()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+        
+        # Wakes up a pending iteration
+        if self._queue is not None:
+            self._queue.put_nowait(None)
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def _send(self, message):
+        await self._ws.send(self.json_dumps(message).decode("utf-8"))
+    
+    async def _on_connect(self, ws):
+        # Runs before subscriptions are restored, the private client logs in here
+        pass
+    
+    async def _on_ready(self):
+        # Runs after every (re)connect once subscriptions are restored
+        pass
+    
+    async def _ready(self, ws):
+        try:
+            await self._on_ready()
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            
+            # A failed resync leaves local state stale, reconnecting runs it again after the backoff
+            self._report(error, None)
+            await ws.close()
+            return
+        
+        # Backoff only starts over once a connection is fully resynchronized
+        self._attempt = 0
+    
+    async def _resubscribe(self):
+        args = [arg for arg, _ in self._subscriptions.values()]
+        if args:
+            await self._send({"op": "subscribe", "args": args})
+    
+    async def _ping(self, ws):
+        # Bitget expects a text "ping" and closes idle connections after two minutes
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            await ws.send("ping")
+    
+    async def run(self):
+        if self._connected is None:
+            self._connected = asyncio.Event()
+        
+        self._attempt = 0
+        while not self._closed:
+            try:
+                async with websockets.connect(self.url, ping_interval=None, max_size=None) as ws:
+                    await self._on_connect(ws)
+                    self._ws = ws
+                    await self._resubscribe()
+                    self._connected.set()
+                    
+                    # The resync runs next to the read loop, so updates keep arriving while it does
+                    ready = asyncio.ensure_future(self._ready(ws))
+                    pinger = asyncio.ensure_future(self._ping(ws))
+                    try:
+                        async for message in ws:
+                            self._dispatch(message)
+                    finally:
+                        pinger.cancel()
+                        ready.cancel()
+            except (websockets.WebSocketException, OSError, asyncio.TimeoutError):
+                pass
+            except BitgetWebsocketException as error:
+                
+                # Rejected logins are not retried
+                self._error = error
+                self._closed = True
+                self._connected.set()
+                break
+            finally:
+                self._ws = None
+                if self._error is None:
+                    self._connected.clear()
+            
+            if self._closed:
+                break
+            
+            # Reconnect with exponential backoff and jitter, subscriptions are restored on connect
+            self.reconnects += 1
+            delay = min(self.max_reconnect_delay, self.reconnect_delay * 2 ** self._attempt)
+            self._attempt += 1
+            await asyncio.sleep(random.uniform(delay / 2, delay))
+    
+    # ########################################
+    # ############### MESSAGES ###############
+    # ########################################
+    
+    def _report(self, error, message):
+        self.errors += 1
+        if self.on_error is not None:
+            try:
+                self.on_error(error, message)
+            except Exception:
+                pass
+    
+    async def _await_callback(self, result, message):
+        try:
+            await result
+        except Exception as error:
+            self._report(error, message)
+    
+    def _dispatch(self, raw):
+        if raw == "pong":
+            return
+        
+        try:
+            message = self.json_loads(raw)
+            arg = message.get("arg")
+        except (ValueError, AttributeError) as error:
+            self._report(error, raw)
+            return
+        
+        if arg is not None and "data" in message:
+            entry = self._subscriptions.get(self._key(arg))
+            if entry is not None:
+                for callback in entry[1]:
+                    
+                    # One failing callback must not end the read loop or starve the others
+                    try:
+                        result = callback(message)
+                        if inspect.isawaitable(result):
+                            asyncio.ensure_future(self._await_callback(result, message))
+                    except Exception as error:
+                        self._report(error, message)
+        
+        # Messages are queued only while someone iterates over the client
+        if self._queue is not None:
+            if self._queue.full():
+                self._queue.get_nowait()
+            self._queue.put_nowait(message)
+    
+    def __aiter__(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+        return self
+    
+    async def __anext__(self):
+        message = await self._queue.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+class PrivateWebsocketClient(WebsocketClient):
+    
+    def __init__(self, api_key, api_secret, passphrase, url=WS_PRIVATE_URL, resync=None, login_timeout=10, **kwargs):
+        
+        super().__init__(url, **kwargs)
+        
+        self.API_KEY = api_key
+        self.API_SECRET = api_secret
+        self.PASSPHRASE = passphrase
+        self.login_timeout = login_timeout
+        
+        # Called after login on startup and after every reconnect, e.g. to reload open orders over REST
+        self.resync = resync
+    
+    def _login_message(self):
+        # Same signature scheme as REST, with the timestamp in seconds
+        timestamp = int(time.time())
+        sign = utils.sign(utils.pre_hash(timestamp, GET, "/user/verify", ""), self.API_SECRET)
+        
+        return {"op": "login", "args": [{
+            "apiKey": self.API_KEY,
+            "passphrase": self.PASSPHRASE,
+            "timestamp": str(timestamp),
+            "sign": sign.decode("utf-8"),
+        }]}
+    
+    async def _on_connect(self, ws):
+        await ws.send(self.json_dumps(self._login_message()).decode("utf-8"))
+        
+        reply = self.json_loads(await asyncio.wait_for(ws.recv(), self.login_timeout))
+        if reply.get("event") != "login" or str(reply.get("code")) != "0":
+            raise BitgetWebsocketException(reply)
+    
+    async def _on_ready(self):
+        if self.resync is None:
+            return
+        
+        # Blocking REST calls run in the default executor so they do not stall the event loop
+        if inspect.iscoroutinefunction(self.resync):
+            await self.resync()
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self.resync)
+    
+    async def subscribe_orders(self, instType="SPOT", instId="default", callback=None):
+        return await self.subscribe("orders", instId, instType, callback)
+    
+    async def subscribe_fills(self, instType="SPOT", instId="default", callback=None):
+        return await self.subscribe("fill", instId, instType, callback)
+    
+    async def subscribe_positions(self, instType="USDT-FUTURES", instId="default", callback=None):
+        return await self.subscribe("positions", instId, instType, callback)
+    
+    async def subscribe_account(self, instType="SPOT", coin="default", callback=None):
+        return await self.subscribe("account", None, instType, callback, coin=coin)
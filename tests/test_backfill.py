@@ -0,0 +1,51 @@
+from pybitapi import Client
+from pybitapi.backfill import CandleBackfill, CsvCandleStore
+
+MINUTE = 60000
+KEY = ("BTCUSDT", "SPOT", "1min")
+
+def fake_history(symbol, granularity, endTime, limit, startTime=None, productType=None):
+    # Newest first, like the venue
+    rows = [[str(ts), "1", "2", "0.5", "1.5", "10", "15", "15"] for ts in range(endTime - limit * MINUTE, endTime, MINUTE)]
+    return {"data": rows[::-1]}
+
+def client():
+    client = Client("key", "secret", "passphrase")
+    client.spot_history_candlestick_data = fake_history
+    return client
+
+def test_torn_last_line_is_ignored_and_truncated(tmp_path):
+    store = CsvCandleStore(str(tmp_path))
+    store.append(KEY, [[str(MINUTE), "1"], [str(2 * MINUTE), "1"]])
+    
+    # A crash in the middle of the next row
+    with open(store._path(KEY), "a") as file:
+        file.write("2400")
+    
+    assert store.last_timestamp(KEY) == 2 * MINUTE
+    assert [row[0] for row in store.read(KEY)] == [str(MINUTE), str(2 * MINUTE)]
+    
+    store.append(KEY, [[str(3 * MINUTE), "1"]])
+    assert [row[0] for row in store.read(KEY)] == [str(MINUTE), str(2 * MINUTE), str(3 * MINUTE)]
+    assert store.last_timestamp(KEY) == 3 * MINUTE
+
+def test_only_torn_line(tmp_path):
+    store = CsvCandleStore(str(tmp_path))
+    with open(store._path(KEY), "w") as file:
+        file.write("24")
+    
+    assert store.last_timestamp(KEY) is None
+    store.append(KEY, [[str(MINUTE), "1"]])
+    assert store.read(KEY) == [[str(MINUTE), "1"]]
+
+def test_backfill_resumes_after_a_torn_write(tmp_path):
+    store = CsvCandleStore(str(tmp_path))
+    backfill = CandleBackfill(client(), store, max_workers=2, limit=100)
+    
+    assert backfill.run("BTCUSDT", "1min", 0, 300 * MINUTE) == 300
+    with open(store._path(KEY), "a") as file:
+        file.write("18000")
+    
+    assert backfill.run("BTCUSDT", "1min", 0, 500 * MINUTE) == 200
+    timestamps = [int(row[0]) for row in store.read(KEY)]
+    assert timestamps == list(range(0, 500 * MINUTE, MINUTE))
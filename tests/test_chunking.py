@@ -0,0 +1,67 @@
+import pytest
+from pybitapi.chunking import merge_batch, split_batch
+from pybitapi.endpoints import ENDPOINTS
+from pybitapi.exceptions import BitgetAPIException
+
+PLACE = ENDPOINTS["spot_batch_place_order"]
+CANCEL = ENDPOINTS["mix_batch_cancel"]
+
+def orders(count):
+    return [{"clientOid": "c%d" % index, "size": "1"} for index in range(count)]
+
+def accept_all(chunk):
+    return {"code": "00000", "msg": "success", "data": {
+        "successList": [{"orderId": "o" + order["clientOid"], "clientOid": order["clientOid"]} for order in chunk["orderList"]],
+        "failureList": [],
+    }}
+
+def test_split_keeps_input_order_and_fills_client_oids():
+    entries, chunks = split_batch(PLACE, {"symbol": "BTCUSDT", "orderList": orders(120) + [{"size": "2"}]})
+    
+    assert [len(chunk["orderList"]) for chunk in chunks] == [50, 50, 21]
+    assert all(chunk["symbol"] == "BTCUSDT" for chunk in chunks)
+    assert [entry for chunk in chunks for entry in chunk["orderList"]] == entries
+    assert entries[-1]["clientOid"]
+
+def test_failed_chunk_marks_exactly_its_entries():
+    entries, chunks = split_batch(PLACE, {"symbol": "BTCUSDT", "orderList": orders(120)})
+    error = BitgetAPIException(429, {"code": "429", "msg": "too many requests"})
+    
+    merged = merge_batch(PLACE, entries, chunks, [accept_all(chunks[0]), error, accept_all(chunks[2])])
+    results = merged["data"]["results"]
+    
+    assert len(results) == 120
+    assert [result["success"] for result in results] == [True] * 50 + [False] * 50 + [True] * 20
+    assert [result["clientOid"] for result in results] == ["c%d" % index for index in range(120)]
+    assert all(result["errorCode"] == "429" for result in results[50:100])
+    assert [failure["clientOid"] for failure in merged["data"]["failureList"]] == ["c%d" % index for index in range(50, 100)]
+    assert len(merged["data"]["successList"]) == 70
+
+def test_per_entry_failures_are_aligned_by_id():
+    entries, chunks = split_batch(PLACE, {"symbol": "BTCUSDT", "orderList": orders(3)})
+    response = {"code": "00000", "data": {
+        "successList": [{"orderId": "o2", "clientOid": "c2"}, {"orderId": "o0", "clientOid": "c0"}],
+        "failureList": [{"clientOid": "c1", "errorCode": "43012", "errorMsg": "insufficient balance"}],
+    }}
+    
+    results = merge_batch(PLACE, entries, chunks, [response])["data"]["results"]
+    
+    assert [(result["clientOid"], result["success"]) for result in results] == [("c0", True), ("c1", False), ("c2", True)]
+
+def test_order_id_lists_are_matched_by_order_id():
+    entries, chunks = split_batch(CANCEL, {"symbol": "BTCUSDT", "productType": "USDT-FUTURES", "orderIdList": [{"orderId": str(index)} for index in range(60)]})
+    error = ConnectionError("reset")
+    response = {"code": "00000", "data": {"successList": [{"orderId": str(index)} for index in range(50)], "failureList": []}}
+    
+    results = merge_batch(CANCEL, entries, chunks, [response, error])["data"]["results"]
+    
+    assert [result["success"] for result in results] == [True] * 50 + [False] * 10
+    assert [result["orderId"] for result in results] == [str(index) for index in range(60)]
+
+def test_all_chunks_failing_raises_the_first_error():
+    entries, chunks = split_batch(PLACE, {"symbol": "BTCUSDT", "orderList": orders(60)})
+    first = BitgetAPIException(503, {"code": "50000"})
+    
+    with pytest.raises(BitgetAPIException) as raised:
+        merge_batch(PLACE, entries, chunks, [first, BitgetAPIException(502, {"code": "50001"})])
+    assert raised.value is first
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import zlib
+from pybitapi.orderbook import LocalOrderBook
+
+SNAPSHOT = {"bids": [["99", "1"], ["98.5", "2"]], "asks": [["100", "1"], ["101.0", "2"]]}
+
+def crc(text):
+    value = zlib.crc32(text.encode("utf-8"))
+    return value - (1 << 32) if value >= 1 << 31 else value
+
+def test_rest_resync_keeps_verifying_checksums():
+    rest = {"data": {"bids": [["99", "1"]], "asks": [["100.0", "2"]], "ts": "1"}}
+    book = LocalOrderBook(snapshot=lambda: rest)
+    book.on_message({"action": "snapshot", "data": [dict(SNAPSHOT, seq=10)]})
+    
+    assert book.apply_update([["96", "1"]], [], checksum=123, seq=11) is False
+    assert book.resyncs == 1
+    
+    # The REST levels keep the venue's strings, so matching checksums pass
+    assert book.checksum() == crc("99:1:100.0:2")
+    assert book.apply_update([["98", "1"]], [], checksum=crc("99:1:100.0:2:98:1"), seq=12) is True
+    
+    # and a later drift is caught instead of accepted
+    assert book.apply_update([["97", "1"]], [], checksum=123, seq=13) is False
+    assert book.resyncs == 2
+    
+    # Deltas older than the last one seen stay stale after a REST snapshot
+    assert book.apply_update([["95", "1"]], [], seq=5) is False
+
+def test_rest_resync_with_numeric_levels():
+    rest = {"data": {"bids": [[99.0, 1.0]], "asks": [[100.5, 2.0]], "ts": "1"}}
+    book = LocalOrderBook(snapshot=lambda: rest)
+    book.on_message({"action": "snapshot", "data": [dict(SNAPSHOT, seq=10)]})
+    book.apply_update([], [], checksum=123, seq=11)
+    
+    # Numeric levels do not break the checksum, a mismatch still resyncs
+    assert book.checksum() == crc("99.0:1.0:100.5:2.0")
+    assert book.apply_update([], [], checksum=123, seq=12) is False
+    assert book.resyncs == 2
+
+def test_rest_resync_runs_off_the_event_loop():
+    release = threading.Event()
+    
+    def snapshot():
+        release.wait(5)
+        return {"data": dict(SNAPSHOT)}
+    
+    async def scenario():
+        book = LocalOrderBook(snapshot=snapshot)
+        book.on_message({"action": "snapshot", "data": [dict(SNAPSHOT, seq=1)]})
+        book.apply_update([], [], checksum=123, seq=2)
+        
+        # The loop is still free while the REST call blocks, updates are dropped meanwhile
+        await asyncio.sleep(0.01)
+        assert book.resyncing
+        assert book.apply_update([["97", "1"]], [], seq=3) is False
+        
+        release.set()
+        while book.resyncing:
+            await asyncio.sleep(0.005)
+        assert book.seq == 2
+    
+    asyncio.run(asyncio.wait_for(scenario(), 10))
+
+def test_resubscribe_resync_waits_for_the_websocket_snapshot():
+    calls = []
+    book = LocalOrderBook(resubscribe=lambda: calls.append(1))
+    book.on_message({"action": "snapshot", "data": [dict(SNAPSHOT, seq=1)]})
+    
+    assert book.apply_update([], [], checksum=123, seq=2) is False
+    assert calls == [1]
+    assert book.apply_update([["97", "1"]], [], seq=3) is False
+    
+    book.on_message({"action": "snapshot", "data": [dict(SNAPSHOT, seq=20)]})
+    assert not book.resyncing
+    assert book.apply_update([["97", "1"]], [], seq=21) is True
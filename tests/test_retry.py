@@ -0,0 +1,60 @@
+import pytest
+from pybitapi.exceptions import BitgetAPIException
+from pybitapi.retry import RetryPolicy
+from pybitapi.variables import GET, POST
+
+CONNECTION_ERRORS = (ConnectionError,)
+
+def unavailable():
+    return BitgetAPIException(503, {"code": "50000", "msg": "busy"})
+
+def test_get_is_idempotent():
+    assert RetryPolicy().is_idempotent(GET, {})
+
+def test_post_without_client_oid_is_never_retried():
+    policy = RetryPolicy()
+    assert not policy.is_idempotent(POST, {"symbol": "BTCUSDT", "side": "buy"})
+    assert not policy.is_idempotent(POST, {"symbol": "BTCUSDT", "clientOid": ""})
+    assert policy.is_idempotent(POST, {"symbol": "BTCUSDT", "clientOid": "a"})
+
+def test_order_list_needs_a_client_oid_on_every_entry():
+    policy = RetryPolicy()
+    assert policy.is_idempotent(POST, {"orderList": [{"clientOid": "a"}, {"clientOid": "b"}]})
+    assert not policy.is_idempotent(POST, {"orderList": [{"clientOid": "a"}, {"size": "1"}]})
+    assert not policy.is_idempotent(POST, {"orderList": [{"clientOid": "a"}, {"clientOid": None}]})
+    assert not policy.is_idempotent(POST, {"orderList": ["1", "2"]})
+
+def test_only_transient_errors_are_retried():
+    policy = RetryPolicy(deadline=None)
+    assert policy.retry_delay(unavailable(), 0, 0, CONNECTION_ERRORS) is not None
+    assert policy.retry_delay(ConnectionError(), 0, 0, CONNECTION_ERRORS) is not None
+    assert policy.retry_delay(BitgetAPIException(400, {"code": "40001"}), 0, 0, CONNECTION_ERRORS) is None
+    assert policy.retry_delay(ValueError(), 0, 0, CONNECTION_ERRORS) is None
+
+def test_retries_stop_at_max_attempts():
+    policy = RetryPolicy(max_attempts=3, deadline=None)
+    assert policy.retry_delay(unavailable(), 0, 0, CONNECTION_ERRORS) is not None
+    assert policy.retry_delay(unavailable(), 1, 0, CONNECTION_ERRORS) is not None
+    assert policy.retry_delay(unavailable(), 2, 0, CONNECTION_ERRORS) is None
+
+def test_retries_stop_at_the_deadline(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("pybitapi.retry.time.monotonic", lambda: now[0])
+    
+    # Full jitter at its maximum, so the sleep itself would cross the deadline
+    monkeypatch.setattr("pybitapi.retry.random.uniform", lambda low, high: high)
+    policy = RetryPolicy(max_attempts=10, backoff=1.0, max_backoff=1.0, deadline=5.0)
+    
+    assert policy.retry_delay(unavailable(), 0, 100.0, CONNECTION_ERRORS) == 1.0
+    now[0] = 103.9
+    assert policy.retry_delay(unavailable(), 1, 100.0, CONNECTION_ERRORS) == 1.0
+    now[0] = 104.5
+    assert policy.retry_delay(unavailable(), 2, 100.0, CONNECTION_ERRORS) is None
+
+def test_attempt_timeout_is_capped_at_the_deadline(monkeypatch):
+    monkeypatch.setattr("pybitapi.retry.time.monotonic", lambda: 108.0)
+    policy = RetryPolicy(deadline=10.0)
+    
+    assert policy.attempt_timeout(100.0, 5.0) == pytest.approx(2.0)
+    assert policy.attempt_timeout(107.0, 5.0) == 5.0
+    assert RetryPolicy(deadline=None).attempt_timeout(100.0, 5.0) == 5.0
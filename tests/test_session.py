@@ -0,0 +1,78 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from pybitapi.session import Session
+from pybitapi.variables import GET
+
+class _Handler(BaseHTTPRequestHandler):
+    
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+class _Server(ThreadingHTTPServer):
+    
+    daemon_threads = True
+    accepted = 0
+    
+    def process_request(self, request, client_address):
+        self.accepted += 1
+        super().process_request(request, client_address)
+
+@pytest.fixture
+def server():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_stats_count_every_connection(server):
+    url = "http://127.0.0.1:%d/" % server.server_address[1]
+    session = Session(pool_maxsize=16)
+    barrier = threading.Barrier(16)
+    
+    def worker():
+        barrier.wait()
+        for _ in range(5):
+            session.request(GET, url, b"", {})
+    
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    stats = session.stats()
+    assert stats["requests"] == 80
+    assert stats["connections_created"] == server.accepted
+    assert stats["connections_reused"] == 80 - server.accepted
+
+def test_idle_connections_are_closed(server):
+    url = "http://127.0.0.1:%d/" % server.server_address[1]
+    session = Session(keep_alive_timeout=0.05)
+    
+    session.request(GET, url, b"", {})
+    session.request(GET, url, b"", {})
+    time.sleep(0.1)
+    session.request(GET, url, b"", {})
+    
+    stats = session.stats()
+    assert stats["connections_created"] == 2 == server.accepted
+    assert stats["connections_reused"] == 1
+    assert stats["idle_closed"] == 1
+
+def test_failed_requests_are_not_reuses():
+    session = Session()
+    with pytest.raises(Session.connection_errors):
+        session.request(GET, "http://127.0.0.1:1/", b"", {}, timeout=1)
+    
+    assert session.stats() == {"requests": 1, "connections_created": 0, "connections_reused": 0, "idle_closed": 0}
@@ -0,0 +1,68 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pybitapi import Client
+from pybitapi.backfill import CandleBackfill, CsvCandleStore
+from pybitapi.store import MmapCandleStore
+
+MINUTE = 60000
+KEY = ("BTCUSDT", "SPOT", "1min")
+
+def client(decode):
+    client = Client("key", "secret", "passphrase", decode_candles=decode, cache=False, rate_limit=False)
+    
+    # Newest first, like the venue
+    def request(method, request_path, data):
+        end = data["endTime"]
+        rows = [[str(ts), "1", str(ts % 7), "0.5", "1.5", "10", "15", "15"] for ts in range(end - data["limit"] * MINUTE, end, MINUTE)]
+        return {"code": "00000", "data": rows[::-1]}
+    
+    client._request = request
+    return client
+
+@pytest.mark.parametrize("decode", [False, True])
+def test_sync(tmp_path, decode):
+    store = MmapCandleStore(str(tmp_path))
+    
+    assert store.sync(client(decode), "BTCUSDT", "1min", 100 * MINUTE, 500 * MINUTE) == 400
+    assert store.sync(client(decode), "BTCUSDT", "1min", 0, 600 * MINUTE) == 200
+    
+    ts = store.timestamps(KEY)
+    assert ts[0] == 0 and len(ts) == 600
+    assert (np.diff(ts) == MINUTE).all()
+    assert (store.columns(KEY)["high"] == ts % 7).all()
+
+@pytest.mark.parametrize("decode", [False, True])
+def test_csv_backfill(tmp_path, decode):
+    store = CsvCandleStore(str(tmp_path))
+    
+    assert CandleBackfill(client(decode), store, limit=100).run("BTCUSDT", "1min", 0, 250 * MINUTE) == 250
+    assert [int(float(row[0])) for row in store.read(KEY)] == list(range(0, 250 * MINUTE, MINUTE))
+
+def test_read_during_prepend_uses_one_generation(tmp_path):
+    writer = MmapCandleStore(str(tmp_path))
+    reader = MmapCandleStore(str(tmp_path))
+    writer.sync(client(False), "BTCUSDT", "1min", 200 * MINUTE, 500 * MINUTE)
+    
+    # Another store prepends history between the reader's first and second column
+    column = reader._column
+    calls = []
+    
+    def racing_column(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            writer.sync(client(False), "BTCUSDT", "1min", 100 * MINUTE, 500 * MINUTE)
+        return column(*args)
+    
+    reader._column = racing_column
+    bars = reader.range(KEY, 250 * MINUTE, 253 * MINUTE)
+    
+    assert list(bars["ts"]) == [250 * MINUTE, 251 * MINUTE, 252 * MINUTE]
+    assert (bars["high"] == bars["ts"] % 7).all()
+    assert writer.count(KEY) == 400
+    
+    # A second prepend removes the generation the reader saw, the live one is untouched
+    writer.sync(client(False), "BTCUSDT", "1min", 0, 500 * MINUTE)
+    assert reader.count(KEY) == 500
+    assert reader.first_timestamp(KEY) == 0
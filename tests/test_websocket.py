@@ -0,0 +1,128 @@
+import asyncio
+import pytest
+
+pytest.importorskip("websockets")
+
+from pybitapi import PrivateWebsocketClient, WebsocketClient
+from tests.ws_stub_server import StubWebsocketServer
+
+TICKER = {"instType": "SPOT", "channel": "ticker", "instId": "BTCUSDT"}
+ORDERS = {"instType": "SPOT", "channel": "orders", "instId": "default"}
+
+async def wait_until(predicate, timeout=5):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 20))
+
+def test_subscribe_and_dispatch():
+    async def scenario():
+        async with StubWebsocketServer() as server:
+            received = []
+            client = WebsocketClient(server.url)
+            await client.subscribe_ticker("BTCUSDT", callback=received.append)
+            
+            async with client:
+                await wait_until(lambda: TICKER in server.subscriptions[-1])
+                await server.publish(TICKER, [{"lastPr": "25000"}])
+                await wait_until(lambda: received)
+            
+            assert received[0]["data"] == [{"lastPr": "25000"}]
+            assert server.connects == 1
+    
+    run(scenario())
+
+def test_reconnect_restores_subscriptions():
+    async def scenario():
+        async with StubWebsocketServer() as server:
+            received = []
+            async with WebsocketClient(server.url, reconnect_delay=0.01) as client:
+                await client.subscribe_ticker("BTCUSDT", callback=received.append)
+                await wait_until(lambda: TICKER in server.subscriptions[-1])
+                
+                await server.drop()
+                await wait_until(lambda: server.connects == 2 and TICKER in server.subscriptions[-1])
+                await client.wait_connected()
+                
+                await server.publish(TICKER, [{"lastPr": "25001"}])
+                await wait_until(lambda: received)
+                
+                assert client.reconnects == 1
+                assert received[0]["data"] == [{"lastPr": "25001"}]
+    
+    run(scenario())
+
+def test_callback_errors_do_not_stop_the_stream():
+    async def scenario():
+        async with StubWebsocketServer() as server:
+            errors = []
+            received = []
+            
+            def failing(message):
+                raise RuntimeError("callback bug")
+            
+            async def failing_async(message):
+                raise RuntimeError("async callback bug")
+            
+            async with WebsocketClient(server.url, on_error=lambda error, message: errors.append(error)) as client:
+                await client.subscribe_ticker("BTCUSDT", callback=failing)
+                await client.subscribe_ticker("BTCUSDT", callback=failing_async)
+                await client.subscribe_ticker("BTCUSDT", callback=received.append)
+                await wait_until(lambda: TICKER in server.subscriptions[-1])
+                
+                await server.send_raw("not json")
+                await server.publish(TICKER, [{"lastPr": "1"}])
+                await server.publish(TICKER, [{"lastPr": "2"}])
+                await wait_until(lambda: len(received) == 2 and len(errors) == 5)
+                
+                assert not client._task.done()
+                assert client.errors == 5
+                assert server.connects == 1
+    
+    run(scenario())
+
+def test_resync_runs_alongside_the_stream():
+    async def scenario():
+        async with StubWebsocketServer() as server:
+            received = []
+            
+            # Only finishes once an update has been read, which deadlocks if the read loop waits for it
+            async def resync():
+                await wait_until(lambda: received)
+            
+            client = PrivateWebsocketClient("key", "secret", "passphrase", url=server.url, resync=resync)
+            await client.subscribe_orders(callback=received.append)
+            
+            async with client:
+                await wait_until(lambda: ORDERS in server.subscriptions[-1])
+                await server.publish(ORDERS, [{"orderId": "1"}])
+                await wait_until(lambda: client._attempt == 0 and received)
+    
+    run(scenario())
+
+def test_failed_resync_reconnects():
+    async def scenario():
+        async with StubWebsocketServer() as server:
+            calls = []
+            
+            def resync():
+                calls.append(1)
+                if len(calls) == 1:
+                    raise RuntimeError("REST unavailable")
+            
+            client = PrivateWebsocketClient("key", "secret", "passphrase", url=server.url, resync=resync, reconnect_delay=0.01)
+            await client.subscribe_orders()
+            
+            async with client:
+                await wait_until(lambda: len(calls) == 2)
+                await client.wait_connected()
+                
+                assert server.connects == 2
+                assert client.errors == 1
+                assert not client._task.done()
+    
+    run(scenario())
@@ -0,0 +1,83 @@
+import json
+import websockets
+
+class StubWebsocketServer():
+    
+    # Local stand-in for the Bitget websocket API: answers ping, login and (un)subscribe,
+    # and lets a test push channel data or drop every connection to force a reconnect
+    def __init__(self, host="127.0.0.1", port=0, login_code=0):
+        self.host = host
+        self.port = port
+        self.login_code = login_code
+        
+        # Subscribed args per accepted connection, in connection order
+        self.subscriptions = []
+        
+        # Live connection -> its subscribed args
+        self.connections = {}
+        self._server = None
+    
+    @property
+    def connects(self):
+        return len(self.subscriptions)
+    
+    @property
+    def url(self):
+        host, port = next(iter(self._server.sockets)).getsockname()[:2]
+        return f"ws://{host}:{port}"
+    
+    async def start(self):
+        self._server = await websockets.serve(self._handler, self.host, self.port)
+        return self
+    
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+    
+    async def __aenter__(self):
+        return await self.start()
+    
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+    
+    async def _handler(self, ws):
+        subscribed = []
+        self.subscriptions.append(subscribed)
+        self.connections[ws] = subscribed
+        
+        try:
+            async for raw in ws:
+                if raw == "ping":
+                    await ws.send("pong")
+                    continue
+                
+                message = json.loads(raw)
+                op = message.get("op")
+                if op == "login":
+                    await ws.send(json.dumps({"event": "login", "code": self.login_code}))
+                elif op in ("subscribe", "unsubscribe"):
+                    for arg in message["args"]:
+                        if op == "subscribe":
+                            subscribed.append(arg)
+                        elif arg in subscribed:
+                            subscribed.remove(arg)
+                        await ws.send(json.dumps({"event": op, "arg": arg}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.connections.pop(ws, None)
+    
+    async def publish(self, arg, data, action="snapshot"):
+        # Sent to every live connection subscribed to arg
+        message = json.dumps({"action": action, "arg": arg, "data": data})
+        for ws, subscribed in list(self.connections.items()):
+            if arg in subscribed:
+                await ws.send(message)
+    
+    async def send_raw(self, raw):
+        for ws in list(self.connections):
+            await ws.send(raw)
+    
+    async def drop(self):
+        for ws in list(self.connections):
+            await ws.close(1012, "service restart")